@@ -1,2 +1,2 @@
 from .core import ShellProtocol     # noqa: F401
-from .spec import ShellFileSystem   # noqa: F401
+from .spec import AsyncShellFileSystem, ShellFileSystem   # noqa: F401
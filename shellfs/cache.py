@@ -0,0 +1,70 @@
+"""
+Provides a small LRU cache with time-to-live (TTL) for filesystem metadata.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+
+class TTLCache:
+    """LRU cache where each cached value expires after ``ttl`` seconds.
+
+    .. code-block:: python
+
+        cache = TTLCache(maxsize=2, ttl=1.0)
+        cache.put("/tmp/some_file.txt", path_entry)
+        path_entry = cache.get("/tmp/some_file.txt")   # -- None, if expired.
+
+    HINT: ``ttl=None`` means: values never expire (like: fsspec DirCache).
+    """
+    DEFAULT_MAXSIZE = 256
+    DEFAULT_TTL = 1.0   # -- UNIT: seconds
+
+    def __init__(self, maxsize: Optional[int] = None,
+                 ttl: Optional[float] = DEFAULT_TTL,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        if maxsize is None:
+            maxsize = self.DEFAULT_MAXSIZE
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def keys(self) -> List[Hashable]:
+        return list(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at is not None and expires_at <= self.timer():
+            # -- CASE: Cached value has expired.
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = self.timer() + self.ttl
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            # -- EVICT: Least-recently-used item.
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
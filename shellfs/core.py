@@ -1,14 +1,23 @@
+import asyncio
+import os
+import re
+import shlex
 from abc import abstractmethod
-from enum import Enum
-from functools import partial
+from array import array
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum, IntEnum
+from functools import lru_cache, partial
 from logging import getLogger
 from subprocess import CalledProcessError, CompletedProcess
 from typing import (
-    Any, Callable, List, Optional,
-    Tuple, TypedDict, Union
+    Any, Callable, Iterable, Iterator, List, Optional,
+    Tuple, Union
 )
 
 from typing_extensions import ParamSpec, Protocol, Self, runtime_checkable
+
+from shellfs.cache import TTLCache
 # -- NOTE ON:
 # - Protocol super().__init__() call problem
 #   * FIXED FOR: Python >= 3.11
@@ -43,6 +52,28 @@ def as_string(text: Union[str, bytes], encoding: Optional[str] = None) -> str:
     return text.decode(encoding)
 
 
+def iter_parents(path: str) -> Iterable[str]:
+    """Yields the parent directories of a path (nearest first)."""
+    parent = os.path.dirname(path)
+    while parent and parent != path:
+        yield parent
+        path, parent = parent, os.path.dirname(parent)
+
+
+@lru_cache(maxsize=64)
+def split_command_schema(command_schema: str) -> Tuple[str, ...]:
+    """Split a command schema into its argv tokens (like a shell would do)."""
+    return tuple(shlex.split(command_schema))
+
+
+@lru_cache(maxsize=8)
+def _make_batch_separator_pattern(separator: Union[str, bytes]) -> "re.Pattern":
+    # -- SCHEMA: {separator}{return_code}<NEWLINE>
+    if isinstance(separator, bytes):
+        return re.compile(re.escape(separator) + rb"(\d+)\n")
+    return re.compile(re.escape(separator) + r"(\d+)\n")
+
+
 # -----------------------------------------------------------------------------
 # SHELL PROTOCOL / INTERFACE
 # -----------------------------------------------------------------------------
@@ -64,7 +95,11 @@ class ErrorDialect:
 
 
 
-class PathType(Enum):
+class PathType(IntEnum):
+    """Type of a path (comparable with: PathType, int, lower-case name string).
+
+    HINT: Values are ints (can be packed into arrays, see: PathEntryBatch).
+    """
     NOT_FOUND = 0
     DIRECTORY = 1
     FILE = 2
@@ -73,22 +108,28 @@ class PathType(Enum):
     def __str__(self):
         return self.name.lower()
 
+    __format__ = Enum.__format__
+
     def __eq__(self, other):
+        if other.__class__ is PathType:
+            # -- FAST-PATH: Enum items are singletons.
+            return self is other
+
         # -- SUPPORT: string-comparison
         # HINT: fsspec uses string-comparison with "file", "directory".
-        if isinstance(other, PathType):
-            return self is other
-        elif isinstance(other, str):
+        if isinstance(other, str):
             return self.name.lower() == other.lower()
+        elif isinstance(other, int):
+            return int(self) == other
         else:
-            message = f"{type(other)} (expected: PathType, string)"
+            message = f"{type(other)} (expected: PathType, int, string)"
             raise TypeError(message)
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
-    def __lt__(self, other):
-        return self.value < other.value
+    # -- HINT: Same hash as its int value (consistent with int-comparison).
+    __hash__ = int.__hash__
 
     @classmethod
     def from_name(cls, name: str) -> Self:
@@ -98,64 +139,197 @@ class PathType(Enum):
         return enum_item
 
 
-class PathEntry(TypedDict):
-    """Provide a dictionary as ValueObject/Record.
+# -- PATHS THAT ARE ALWAYS A DIRECTORY: current directory, root directory
+# HINT: fsspec strips "/" to "" (root_marker) that is mapped to ROOT_DIRECTORY.
+ROOT_DIRECTORY = "/"
+WELL_KNOWN_DIRECTORIES = frozenset([".", ROOT_DIRECTORY])
+
+
+# -- FAST LOOKUP: PathType by value (instead of: PathType(value)).
+_PATH_TYPE_BY_VALUE = {path_type.value: path_type for path_type in PathType}
+
+
+class PathEntry(MutableMapping):
+    """Provide a ValueObject/Record with dictionary-like access.
+
+    Uses ``__slots__`` (instead of a dictionary per entry) to reduce memory.
 
     .. code-block:: python
 
         # -- EXAMPLE:
-        result = {
-            "name": path,
-            "size": size,
-            "type": t,
-            "created": out.st_ctime,
-            "islink": link,
-        }
+        path_entry = PathEntry(name=path, type=PathType.FILE, size=size)
+        assert path_entry["name"] == path_entry.name
+        assert path_entry.get("size") == size
     """
-    name: str
-    type: PathType
-    size: int = 0
-    islink: bool = False
+    __slots__ = ("name", "type", "size", "islink")
+    FIELD_NAMES = __slots__
     # MAYBE-LATER: created: str or DateTime
 
+    def __init__(self, name: str, type: PathType,
+                 size: Optional[int] = 0, islink: bool = False) -> None:
+        self.name = name
+        self.type = type
+        self.size = size
+        self.islink = islink
+
     def exists(self) -> bool:
-        return self["type"] is not PathType.NOT_FOUND
+        return self.type is not PathType.NOT_FOUND
 
     def is_not_found(self) -> bool:
-        return self["type"] is PathType.NOT_FOUND
+        return self.type is PathType.NOT_FOUND
 
     @classmethod
     def make_not_found(cls, name: str) -> Self:
-        return dict(name=name, type=PathType.NOT_FOUND, size=0)
+        return cls(name=name, type=PathType.NOT_FOUND, size=0)
+
+    # -- DICT-LIKE ACCESS: Needed by fsspec, like: info["name"], info.get("size")
+    def __getitem__(self, name: str) -> Any:
+        if name not in self.FIELD_NAMES:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        if name not in self.FIELD_NAMES:
+            raise KeyError(name)
+        setattr(self, name, value)
+
+    def __delitem__(self, name: str) -> None:
+        # -- HINT: Fields are fixed (use: copy() to get a dict).
+        raise TypeError(f"{name} (PathEntry fields can not be deleted)")
+
+    def __iter__(self):
+        return iter(self.FIELD_NAMES)
+
+    def __len__(self) -> int:
+        return len(self.FIELD_NAMES)
+
+    def copy(self) -> dict:
+        """Provides a (shallow) copy as dict (like: dict.copy(), used by fsspec)."""
+        return {name: getattr(self, name) for name in self.FIELD_NAMES}
+
+    def __repr__(self) -> str:
+        return (f"PathEntry(name={self.name!r}, type={self.type!r}, "
+                f"size={self.size!r}, islink={self.islink!r})")
 
     def __eq__(self, other):
-        size_matched = (
-            (self["size"] == other["size"]) or
-            (self["size"] is None) or (other["size"] is None)
-        )
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        other_type = other.get("type")
+        if other_type is None:
+            return False
+        size, other_size = self.size, other.get("size")
+        # -- HINT: Unknown size (None) matches any size.
+        size_matched = (size == other_size) or (size is None) or (other_size is None)
         return (
-            self["name"] == other["name"] and
-            self["type"] == other["type"] and
+            self.name == other.get("name") and
+            self.type == other_type and
             size_matched
         )
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
-
     def __lt__(self, other):
-        size_lessthan = (self["size"] < other["size"]) or (self["size"] is None)
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        size, other_size = self.size, other.get("size")
+        size_lessthan = (size is None) or (other_size is not None and size < other_size)
+        other_type, other_name = other.get("type"), other.get("name")
         return (
-            (self["type"] < other["type"]) or
-            ((self["type"] == other["type"]) and (self["name"] < other["name"])) or
-            ((self["type"] == other["type"]) and (self["name"] == other["name"]) and size_lessthan)
+            (self.type < other_type) or
+            ((self.type == other_type) and (self.name < other_name)) or
+            ((self.type == other_type) and (self.name == other_name) and size_lessthan)
         )
 
 
+class PathEntryBatch:
+    """Provides many path entries as parallel columns (structure-of-arrays).
+
+    This avoids one object per entry for large directory listings.
+    Types and sizes are stored as compact arrays of integers.
+    Use :meth:`as_entries()` to get a list of :class:`PathEntry` items.
+
+    .. code-block:: python
+
+        batch = PathEntryBatch()
+        batch.append("some_file.txt", PathType.FILE, 123)
+        batch.names         # -- ["some_file.txt"]
+        batch.as_entries()  # -- [{"name": "some_file.txt", "type": ..., "size": 123}]
+    """
+    __slots__ = ("names", "type_values", "sizes", "_index_by_name")
+    TYPE_CODE4TYPES = "b"   # -- signed char: PathType.value
+    TYPE_CODE4SIZES = "q"   # -- signed long long: size in bytes
+
+    def __init__(self, names: Optional[List[str]] = None,
+                 types: Optional[Iterable[PathType]] = None,
+                 sizes: Optional[Iterable[int]] = None,
+                 type_values: Optional[Iterable[int]] = None) -> None:
+        if type_values is None and types is not None:
+            type_values = types     # -- HINT: PathType items are packed as ints.
+        self.names = names if names is not None else []
+        self.type_values = array(self.TYPE_CODE4TYPES, type_values or ())
+        self.sizes = array(self.TYPE_CODE4SIZES, sizes or ())
+        self._index_by_name = None
+
+    @property
+    def types(self) -> List[PathType]:
+        return [_PATH_TYPE_BY_VALUE[value] for value in self.type_values]
+
+    @classmethod
+    def from_entries(cls, path_entries: Iterable[PathEntry]) -> Self:
+        batch = cls()
+        for path_entry in path_entries:
+            batch.append(path_entry["name"], path_entry["type"], path_entry["size"])
+        return batch
+
+    def append(self, name: str, path_type: PathType, size: int) -> None:
+        self.names.append(name)
+        self.type_values.append(path_type.value)
+        self.sizes.append(size)
+        self._index_by_name = None
+
+    def find(self, name: str) -> Optional[int]:
+        """Find the index of an entry by its name (or None: if not found).
+
+        HINT: Name index is built on first use (for many lookups).
+        """
+        if self._index_by_name is None:
+            self._index_by_name = {name: index for index, name in enumerate(self.names)}
+        return self._index_by_name.get(name)
+
+    def as_entries(self) -> List[PathEntry]:
+        path_types = _PATH_TYPE_BY_VALUE
+        return [PathEntry(name=name, type=path_types[value], size=size)
+                for name, value, size in zip(self.names, self.type_values, self.sizes)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.as_entries())
+
+    def __getitem__(self, index: int) -> PathEntry:
+        return PathEntry(name=self.names[index],
+                         type=_PATH_TYPE_BY_VALUE[self.type_values[index]],
+                         size=self.sizes[index])
+
+    def __eq__(self, other):
+        if isinstance(other, PathEntryBatch):
+            other = other.as_entries()
+        return self.as_entries() == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.as_entries()!r}>"
+
+
 class FSOperation(Enum):
     """Enumeration of filesystem operations."""
     UNKNOWN = 0
     INFO = 1
     LISTDIR = 2
+    EXISTS = 3
 
     # -- CREATE OPERATION(s):
     MKDIR = 10
@@ -169,11 +343,21 @@ class FSOperation(Enum):
     RMDIR = 21
     REMOVE_FILE = 22
 
+    def is_mutating(self) -> bool:
+        """Indicates if this operation may change the filesystem."""
+        return self.value >= FSOperation.MKDIR.value
+
 
 class FSOpsCommand:
-    """Provides a mapping for filesystem operations to shell commands."""
+    """Provides a mapping for filesystem operations to shell commands.
+
+    If ``USE_COMMAND_ARGV`` is true, a command is provided as argv list
+    (instead of a string) that can be run without an intermediate shell.
+    """
+    USE_COMMAND_ARGV = False
     COMMAND_SCHEMA4INFO = None
     COMMAND_SCHEMA4LISTDIR = None
+    COMMAND_SCHEMA4EXISTS = None
     COMMAND_SCHEMA4MKDIR = None
     COMMAND_SCHEMA4MAKEDIRS = None
     COMMAND_SCHEMA4TOUCH = None
@@ -181,19 +365,82 @@ class FSOpsCommand:
     COMMAND_SCHEMA4RMTREE = None
     COMMAND_SCHEMA4RMDIR = None
     COMMAND_SCHEMA4REMOVE_FILE = None
+    COMMAND_SCHEMA4INFO_MANY = None     # -- SCHEMA: Command prefix (paths are appended).
+    INFO_MANY_MAX_PATHS = 512           # -- HINT: Keep command line below ARG_MAX.
+    BATCH_SEPARATOR = "---SHELLFS-SEP:"
+
+    _SCHEMA_BY_OP = {}
+    _SIMPLE_SCHEMA_BY_OP = {}
+    _SIMPLE_PLACEHOLDER_PATTERN = re.compile(r"[^{}]*\{(\w+)\}[^{}]*")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._SCHEMA_BY_OP = cls._collect_command_schemas()
+        cls._SIMPLE_SCHEMA_BY_OP = cls._collect_simple_schemas()
+
+    @classmethod
+    def _collect_command_schemas(cls):
+        # -- SCHEMA: COMMAND_SCHEMA4{operation.name} = command_schema
+        schema_by_op = {}
+        for operation in FSOperation:
+            command_schema = getattr(cls, f"COMMAND_SCHEMA4{operation.name}", None)
+            if command_schema is not None:
+                schema_by_op[operation] = command_schema
+        return schema_by_op
+
+    @classmethod
+    def _collect_simple_schemas(cls):
+        """Collect schemas with only one placeholder, like: "ls {path}".
+
+        SCHEMA: operation -> (name, placeholder, argv_tokens, argv_index)
+        HINT: argv_index is None, if the placeholder is not a complete token.
+        """
+        simple_by_op = {}
+        for operation, command_schema in cls._SCHEMA_BY_OP.items():
+            matched = cls._SIMPLE_PLACEHOLDER_PATTERN.fullmatch(command_schema)
+            if not matched:
+                continue
+
+            name = matched.group(1)
+            placeholder = "{%s}" % name
+            argv_tokens = split_command_schema(command_schema)
+            argv_index = None
+            if placeholder in argv_tokens:
+                argv_index = argv_tokens.index(placeholder)
+            simple_by_op[operation] = (name, placeholder, argv_tokens, argv_index)
+        return simple_by_op
+
+    @classmethod
+    def has_command_schema_for(cls, operation: FSOperation) -> bool:
+        """Indicates if this dialect provides a command for an operation."""
+        return operation in cls._SCHEMA_BY_OP
 
     def _select_command_schema_for(self, operation: FSOperation) -> str:
-        schema_name = f"COMMAND_SCHEMA4{operation.name}"
-        command_schema = getattr(self, schema_name, None)
-        if command_schema is None:
+        try:
+            return self._SCHEMA_BY_OP[operation]
+        except KeyError:
             # -- UNKNOWN-OPERATION:
-            raise LookupError(operation)
-
-        # -- NORMAL-CASE:
-        return command_schema
+            raise LookupError(operation) from None
 
-    def _make_command_for(self, operation: FSOperation, **kwargs) -> str:
+    def _make_command_for(self, operation: FSOperation, **kwargs) -> Union[str, List[str]]:
         command_schema = self._select_command_schema_for(operation)
+        simple_schema = self._SIMPLE_SCHEMA_BY_OP.get(operation)
+        if simple_schema is not None and len(kwargs) == 1:
+            # -- FAST-PATH: Only one placeholder (without str.format() call).
+            name, placeholder, argv_tokens, argv_index = simple_schema
+            if name in kwargs:
+                value = str(kwargs[name])
+                if not self.USE_COMMAND_ARGV:
+                    return command_schema.replace(placeholder, value)
+                if argv_index is not None:
+                    argv = list(argv_tokens)
+                    argv[argv_index] = value
+                    return argv
+
+        # -- NORMAL-CASE:
+        if self.USE_COMMAND_ARGV:
+            return [token.format(**kwargs)
+                    for token in split_command_schema(command_schema)]
         return command_schema.format(**kwargs)
 
     # -- MAKE-COMMAND FUNCTIONS:
@@ -203,6 +450,9 @@ class FSOpsCommand:
     def make_command4listdir(self, directory: str) -> str:
         return self._make_command_for(FSOperation.LISTDIR, directory=directory)
 
+    def make_command4exists(self, path: str) -> str:
+        return self._make_command_for(FSOperation.EXISTS, path=path)
+
     def make_command4mkdir(self, directory: str) -> str:
         return self._make_command_for(FSOperation.MKDIR, directory=directory)
 
@@ -226,11 +476,88 @@ class FSOpsCommand:
     def make_command4remove_file(self, path: str) -> str:
         return self._make_command_for(FSOperation.REMOVE_FILE, path=path)
 
+    def make_command4info_many(self, paths: Iterable[str]) -> Union[str, List[str]]:
+        """Build one command that provides info on many paths (if supported).
+
+        :raises LookupError: If COMMAND_SCHEMA4INFO_MANY is not provided.
+        """
+        command_schema = self.COMMAND_SCHEMA4INFO_MANY
+        if command_schema is None:
+            raise LookupError("INFO_MANY")
+
+        argv = list(split_command_schema(command_schema))
+        argv.extend(os.fspath(path) for path in paths)
+        if self.USE_COMMAND_ARGV:
+            return argv
+        return shlex.join(argv)
+
+    # -- BATCH SUPPORT: Run many commands in one shell invocation.
+    def make_batch_command(self, operation: FSOperation,
+                           paths: Iterable[str],
+                           sep: Optional[str] = None) -> str:
+        """Build one shell command that runs the operation for each path.
+
+        Each command is followed by a separator line with its return code,
+        like: ``{sep}{return_code}``.
+        """
+        fsops = [(operation, path) for path in paths]
+        return self.make_batch_command4fsops(fsops, sep=sep)
+
+    def make_batch_command4fsops(self, fsops: Iterable[Tuple[FSOperation, str]],
+                                 sep: Optional[str] = None) -> str:
+        """Build one shell command for many (operation, path) pairs."""
+        commands = [self._make_shell_command_for(operation, path)
+                    for operation, path in fsops]
+        return self.join_commands(commands, sep=sep)
+
+    def make_command4info_and_listdir(self, path: str) -> str:
+        fsops = [(FSOperation.INFO, path), (FSOperation.LISTDIR, path)]
+        return self.make_batch_command4fsops(fsops)
+
+    def _make_shell_command_for(self, operation: FSOperation, path: str) -> str:
+        func_name = f"make_command4{operation.name.lower()}"
+        make_command_func = getattr(self, func_name)
+        if self.USE_COMMAND_ARGV:
+            return shlex.join(make_command_func(os.fspath(path)))
+        return make_command_func(shlex.quote(os.fspath(path)))
+
+    @classmethod
+    def join_commands(cls, commands: Iterable[str], sep: Optional[str] = None) -> str:
+        sep = sep or cls.BATCH_SEPARATOR
+        return "; ".join(f"{command}; echo '{sep}'$?" for command in commands)
+
+    @classmethod
+    def split_batch_output(cls, output: Union[bytes, str],
+                           sep: Optional[str] = None) -> List[Tuple[int, Union[bytes, str]]]:
+        """Split the output of a batch command into its parts.
+
+        HINT: Output parts have the same type as the output (bytes or str).
+
+        :return: List of (return_code, output) tuples (one for each command).
+        """
+        sep = sep or cls.BATCH_SEPARATOR
+        if isinstance(output, bytes):
+            sep = sep.encode(DEFAULT_ENCODING)
+        pattern = _make_batch_separator_pattern(sep)
+        parts = pattern.split(output)
+        # -- SCHEMA: [output0, return_code0, output1, return_code1, ..., tail]
+        return [(int(return_code), chunk)
+                for chunk, return_code in zip(parts[0::2], parts[1::2])]
+
     # -- MAKE-RESULT FUNCTIONS:
     def make_result4info(self, result: CommandResult, path: str) -> PathEntry:
         return NotImplemented
 
-    def make_result4listdir(self, result: CommandResult, directory: str) -> List[PathEntry]:
+    def make_result4listdir(self, result: CommandResult, directory: str) -> PathEntryBatch:
+        return NotImplemented
+
+    def make_result4info_many(self, result: CommandResult,
+                              paths: List[str]) -> List[Optional[PathEntry]]:
+        """Map the output of :meth:`make_command4info_many()` back to paths.
+
+        :return: List of path entries (same order as paths).
+                 An entry is None if it could not be mapped to its path.
+        """
         return NotImplemented
 
     @classmethod
@@ -249,6 +576,11 @@ class FSOpsCommand:
 """)
         return result
 
+    @classmethod
+    def make_result4exists(cls, result: CommandResult, path: str) -> bool:
+        # -- HINT: Only the return code is needed (no output parsing).
+        return result.returncode == 0
+
     @classmethod
     def make_result4mkdir(cls, result: CommandResult, directory: str) -> CommandResult:
         return cls.make_result4any(FSOperation.MKDIR, result,
@@ -287,6 +619,11 @@ class ShellProtocol(Protocol):
     """Protocol for shell(s) that run command(s) as filesystem operations."""
     FSOPS_COMMAND_CLASS = None
     ERROR_DIALECT_CLASS = ErrorDialect
+    # -- IS_LOCAL: Paths are on the local filesystem (can be checked by: os.stat()).
+    IS_LOCAL = False
+    # -- DIRECT_FSOPS: Operations provided without command, like:
+    #    FSOperation.INFO by method: direct_info(path)
+    DIRECT_FSOPS = ()
 
     def __init__(self,
                  fsops_command: Optional[FSOpsCommand] = None,
@@ -318,9 +655,21 @@ class ShellProtocol(Protocol):
     #     self.fsops_command = fsops_command
 
     @abstractmethod
-    def run(self, command: str, timeout: Optional[float] = None) -> CommandResult:
+    def run(self, command: Union[str, List[str]],
+            timeout: Optional[float] = None) -> CommandResult:
+        """Run a command (as string: in a shell, as argv list: without shell)."""
         ...
 
+    async def arun(self, command: Union[str, List[str]],
+                   timeout: Optional[float] = None) -> CommandResult:
+        """Run a command without blocking the event loop.
+
+        HINT: Default implementation runs :meth:`run()` in a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.run, command,
+                                                        timeout=timeout))
+
 
 class FileSystemProtocol:
     """
@@ -328,22 +677,62 @@ class FileSystemProtocol:
 
     * It provides a simple, stable API to the :class:`ShellFileSystem`.
     * It coordinates the execution of filesystem operations provided by a shell.
+    * It caches the results of :meth:`info()` and :meth:`listdir()` for a short
+      time (if ``use_listings_cache`` is true). Cached results are invalidated
+      by any mutating filesystem operation.
+    * ``listings_expiry_time`` has the same meaning as for fsspec's DirCache:
+      Seconds until a cached result expires (None: never expires).
+      Default is :attr:`DEFAULT_LISTINGS_EXPIRY_TIME` (one second).
+    * Paths that were not found are remembered in a negative-lookup cache
+      with a shorter expiry time.
+    * Cached listings of a local shell are also checked against the
+      modification time of their directory (if entries were added/removed).
     """
-    def __init__(self, shell: ShellProtocol):
+    CACHE_OPTION_NAMES = ("use_listings_cache", "listings_expiry_time", "max_paths")
+    DEFAULT_LISTINGS_EXPIRY_TIME = TTLCache.DEFAULT_TTL    # -- UNIT: seconds
+    DEFAULT_MAX_PATHS = 4096
+    INFO_MAX_WORKERS = 8
+    MISSING_CACHE_MAXSIZE = 1024
+    MISSING_CACHE_TTL = 0.5     # -- UNIT: seconds
+
+    def __init__(self, shell: ShellProtocol,
+                 use_listings_cache: bool = True,
+                 listings_expiry_time: Optional[float] = DEFAULT_LISTINGS_EXPIRY_TIME,
+                 max_paths: Optional[int] = None):
         self.shell = shell
         self.fsops_command = shell.fsops_command
         self.error_dialect = shell.error_dialect
-        self._fsop_functions_map = {}
+        self._fsop_funcs = []
+        self._direct_funcs = []
+        self._info_cache = None
+        self._listdir_cache = None
+        self._missing = None
+        self._validates_listings = bool(getattr(shell, "IS_LOCAL", False))
         self._setup_fsop_functions_map()
+        if max_paths is None:
+            max_paths = self.DEFAULT_MAX_PATHS
+        if use_listings_cache:
+            self._info_cache = TTLCache(maxsize=max_paths, ttl=listings_expiry_time)
+            self._listdir_cache = TTLCache(maxsize=max_paths, ttl=listings_expiry_time)
+            self._missing = TTLCache(maxsize=self.MISSING_CACHE_MAXSIZE,
+                                     ttl=self.MISSING_CACHE_TTL)
 
     def _setup_fsop_functions_map(self):
+        # -- FAST LOOKUP: By operation.value (instead of dict lookup).
+        max_value = max(operation.value for operation in FSOperation)
+        self._fsop_funcs = [None] * (max_value + 1)
         for operation in iter(FSOperation):
             if operation is FSOperation.UNKNOWN:
                 continue
 
             # -- SCHEMA: make_command_func, make_result_func
-            fsop_functions = self._select_fsop_functions(operation)
-            self._fsop_functions_map[operation] = fsop_functions
+            self._fsop_funcs[operation.value] = self._select_fsop_functions(operation)
+
+        # -- DIRECT FSOPS: Provided by the shell without any command.
+        self._direct_funcs = [None] * (max_value + 1)
+        for operation in self.shell.DIRECT_FSOPS:
+            direct_func = getattr(self.shell, f"direct_{operation.name.lower()}")
+            self._direct_funcs[operation.value] = direct_func
 
     def _select_fsop_functions(self, operation) -> Tuple[Callable, Callable]:
         operation_name = operation.name.lower()
@@ -356,23 +745,476 @@ class FileSystemProtocol:
         return make_command_func, make_result_func
 
     def run_fsop(self, operation, **kwargs) -> Any:
-        make_command_func, make_result_func = self._fsop_functions_map[operation]
+        direct_func = self._direct_funcs[operation.value]
+        if direct_func is not None:
+            # -- FAST-PATH: Shell provides this operation directly.
+            return direct_func(**kwargs)
+
+        make_command_func, make_result_func = self._fsop_funcs[operation.value]
         command = make_command_func(**kwargs)
         result = self.shell.run(command)
-        result.stdout = as_string(result.stdout)
-        result.stderr = as_string(result.stderr)
+        if operation.is_mutating():
+            self._invalidate_paths(kwargs.values())
+        # -- NOTE: Output is passed as bytes (decoded only when needed).
         return make_result_func(result, **kwargs)
 
-    def info(self, path: str) -> PathEntry:
-        return self.run_fsop(FSOperation.INFO, path=path)
+    async def arun_fsop(self, operation, **kwargs) -> Any:
+        """Async variant of :meth:`run_fsop()` (for concurrent fsops)."""
+        direct_func = self._direct_funcs[operation.value]
+        if direct_func is not None:
+            return direct_func(**kwargs)
+
+        make_command_func, make_result_func = self._fsop_funcs[operation.value]
+        command = make_command_func(**kwargs)
+        result = await self.shell.arun(command)
+        if operation.is_mutating():
+            self._invalidate_paths(kwargs.values())
+        return make_result_func(result, **kwargs)
+
+    def run_fsop_batch(self, operation: FSOperation, paths: Iterable[str]) -> List[Any]:
+        """Run a filesystem operation for many paths in one shell invocation.
+
+        :return: List of results (one for each path, same order as paths).
+        """
+        return self.run_fsops_batch([(operation, path) for path in paths])
+
+    def run_fsops_batch(self, fsops: Iterable[Tuple[FSOperation, str]],
+                        command: Optional[str] = None) -> List[Any]:
+        """Run many (operation, path) pairs in one shell invocation.
+
+        :param fsops: List of (operation, path) pairs.
+        :param command: Prepared batch command for these fsops (optional).
+        :return: List of results (one for each pair, same order as fsops).
+        """
+        fsops = list(fsops)
+        if not fsops:
+            return []
+        if self._has_direct_funcs_for(operation for operation, _ in fsops):
+            return [self._direct_funcs[operation.value](path)
+                    for operation, path in fsops]
+
+        if command is None:
+            command = self.fsops_command.make_batch_command4fsops(fsops)
+        result = self.shell.run(command)
+        self._invalidate_paths(path for operation, path in fsops
+                               if operation.is_mutating())
+        # -- NOTE: Output is passed as bytes (decoded only when needed).
+        stderr = result.stderr or b""
+        parts = self.fsops_command.split_batch_output(result.stdout or b"")
+        if len(parts) < len(fsops):
+            # -- CASE: Batch was aborted (shell died, timeout, ...).
+            missing_count = len(fsops) - len(parts)
+            parts.extend([(result.returncode or 1, b"")] * missing_count)
+
+        results = []
+        for (operation, path), (return_code, output) in zip(fsops, parts):
+            _, make_result_func = self._fsop_funcs[operation.value]
+            this_result = CommandResult(command, returncode=return_code,
+                                        stdout=output,
+                                        stderr=stderr if return_code else b"")
+            results.append(make_result_func(this_result, path))
+        return results
+
+    def _has_direct_funcs_for(self, operations: Iterable[FSOperation]) -> bool:
+        return all(self._direct_funcs[operation.value] is not None
+                   for operation in operations)
+
+    # -- CACHE SUPPORT:
+    @staticmethod
+    def _make_cache_key(path: str) -> Optional[str]:
+        """Provides the cache key of a path (or None: if it is not cacheable).
+
+        HINT: The empty path is never cached (abspath would map it to the
+        current working directory, like ".").
+        """
+        path = os.fspath(path)
+        if not path:
+            return None
+        # -- HINT: Relative paths depend on the current working directory.
+        return os.path.abspath(path)
+
+    def _invalidate_paths(self, paths: Iterable[str]) -> None:
+        if self._info_cache is None:
+            return
+        for path in paths:
+            self.invalidate_cache(path)
+
+    def invalidate_cache(self, path: Optional[str] = None) -> None:
+        """Discard cached results for a path, its parents and its descendants.
+
+        :param path: Path to invalidate (or None: to discard all cached results).
+        """
+        if self._info_cache is None:
+            return
+        caches = (self._info_cache, self._listdir_cache, self._missing)
+        if path is None:
+            for cache in caches:
+                cache.clear()
+            return
+
+        cache_key = self._make_cache_key(path)
+        if cache_key is None:
+            return
+        prefix = os.path.join(cache_key, "")
+        parents = list(iter_parents(cache_key))
+        for cache in caches:
+            cache.discard(cache_key)
+            # -- DESCENDANTS: Needed for RMTREE, ...
+            for key in cache.keys():
+                if key.startswith(prefix):
+                    cache.discard(key)
+            # -- PARENTS: Contents/size/timestamp of a directory have changed.
+            for parent in parents:
+                cache.discard(parent)
+
+    def _get_listing_mtime(self, cache_key: str) -> Optional[int]:
+        """Provides the modification time of a local directory (to validate its listing).
+
+        :return: Modification time (in ns); -1 (if not validated); None (if not found).
+        """
+        if not self._validates_listings:
+            return -1
+        if cache_key is None:
+            return None
+        try:
+            return os.stat(cache_key).st_mtime_ns
+        except (OSError, ValueError):
+            return None
+
+    def _get_cached_listing(self, cache_key: Optional[str]) -> Optional[PathEntryBatch]:
+        if cache_key is None:
+            return None
+        cached = self._listdir_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        mtime, path_entries = cached
+        if mtime != self._get_listing_mtime(cache_key):
+            # -- CASE: Directory was changed by others (entries added/removed/renamed).
+            self._listdir_cache.discard(cache_key)
+            return None
+        return path_entries
+
+    def _put_cached_listing(self, cache_key: Optional[str], path_entries: PathEntryBatch,
+                            mtime: Optional[int]) -> None:
+        # -- HINT: mtime must be determined BEFORE the directory is listed.
+        if cache_key is not None and mtime is not None:
+            self._listdir_cache.put(cache_key, (mtime, path_entries))
+
+    # -- FILESYSTEM OPERATIONS:
+    def _get_cached_info(self, cache_key: Optional[str], path: str) -> Optional[PathEntry]:
+        if cache_key is None:
+            return None
+        if cache_key in self._missing:
+            return PathEntry.make_not_found(name=path)
+        path_entry = self._info_cache.get(cache_key)
+        if path_entry is None:
+            return self._get_cached_info_from_listing(cache_key, path)
+
+        # -- HINT: Provide a copy (callers may modify it) that is named like
+        # the requested path (cached for another spelling, like: relative path).
+        return PathEntry(name=os.fspath(path), type=path_entry.type,
+                         size=path_entry.size, islink=path_entry.islink)
+
+    def _get_cached_info_from_listing(self, cache_key: str, path: str) -> Optional[PathEntry]:
+        """Provides info on a path from the cached listing of its directory."""
+        parent_key, name = os.path.split(cache_key)
+        if not name:
+            return None
+        parent_entry = self._info_cache.get(parent_key)
+        if parent_entry is None or parent_entry["type"] is not PathType.DIRECTORY:
+            return None
+        path_entries = self._get_cached_listing(parent_key)
+        if path_entries is None:
+            return None
+
+        index = path_entries.find(name)
+        if index is None:
+            # -- CASE: Not contained in (recent) listing of its directory.
+            # HINT: Listing may omit entries (like: device files, unusual names).
+            # Therefore, only positive lookups are provided (otherwise: cache miss).
+            return None
+        path_entry = path_entries[index]
+        path_entry["name"] = os.fspath(path)
+        return path_entry
+
+    def _put_cached_info(self, cache_key: Optional[str], path_entry: PathEntry) -> None:
+        if cache_key is None:
+            return
+        if path_entry["type"] is PathType.NOT_FOUND:
+            self._missing.put(cache_key, True)
+        else:
+            # -- SNAPSHOT: Caller may modify its path_entry later.
+            self._info_cache.put(cache_key, PathEntry(
+                name=path_entry.name, type=path_entry.type,
+                size=path_entry.size, islink=path_entry.islink))
 
-    def listdir(self, directory: str) -> List[PathEntry]:
-        return self.run_fsop(FSOperation.LISTDIR, directory=directory)
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """Maps the empty path (root_marker of fsspec) to the root directory."""
+        if path == "":
+            return ROOT_DIRECTORY
+        return path
+
+    @staticmethod
+    def _get_well_known_info(path: str) -> Optional[PathEntry]:
+        """Provides info on the current/root directory (without a command)."""
+        if path in WELL_KNOWN_DIRECTORIES:
+            return PathEntry(name=path, type=PathType.DIRECTORY, size=None)
+        return None
+
+    def info(self, path: str) -> PathEntry:
+        path = self._normalize_path(path)
+        path_entry = self._get_well_known_info(path)
+        if path_entry is not None:
+            return path_entry
+        if self._info_cache is None:
+            return self.run_fsop(FSOperation.INFO, path=path)
+
+        cache_key = self._make_cache_key(path)
+        path_entry = self._get_cached_info(cache_key, path)
+        if path_entry is None:
+            path_entry = self.run_fsop(FSOperation.INFO, path=path)
+            self._put_cached_info(cache_key, path_entry)
+        return path_entry
+
+    def info_many(self, paths: Iterable[str]) -> List[PathEntry]:
+        """Provides info for many paths with one command (without caching).
+
+        Falls back to concurrent INFO commands, if the shell dialect provides
+        no multi-path command (see: :meth:`info_many_parallel()`), or to a
+        batch of INFO commands (if some paths could not be mapped back).
+        """
+        paths = [self._normalize_path(path) for path in paths]
+        well_known_entries = [self._get_well_known_info(path) for path in paths]
+        if any(path_entry is not None for path_entry in well_known_entries):
+            # -- CASE: Some paths are well-known directories (without command).
+            queried = [index for index, path_entry in enumerate(well_known_entries)
+                       if path_entry is None]
+            queried_entries = self.info_many([paths[index] for index in queried])
+            for index, path_entry in zip(queried, queried_entries):
+                well_known_entries[index] = path_entry
+            return well_known_entries
+
+        if not paths:
+            return []
+        if self._has_direct_funcs_for([FSOperation.INFO]):
+            return self.run_fsops_batch((FSOperation.INFO, path) for path in paths)
+
+        try:
+            max_paths = self.fsops_command.INFO_MANY_MAX_PATHS
+            path_entries = []
+            for start in range(0, len(paths), max_paths):
+                these_paths = paths[start:start + max_paths]
+                command = self.fsops_command.make_command4info_many(these_paths)
+                result = self.shell.run(command)
+                path_entries.extend(
+                    self.fsops_command.make_result4info_many(result, these_paths))
+        except LookupError:
+            # -- CASE: No multi-path command (run one INFO command per path).
+            return self.info_many_parallel(paths)
+
+        unmapped = [index for index, path_entry in enumerate(path_entries)
+                    if path_entry is None]
+        if unmapped:
+            # -- CASE: Output could not be mapped to its path (unusual names).
+            unmapped_entries = self.run_fsop_batch(FSOperation.INFO,
+                                                   [paths[index] for index in unmapped])
+            for index, path_entry in zip(unmapped, unmapped_entries):
+                path_entries[index] = path_entry
+        return path_entries
+
+    def info_many_parallel(self, paths: Iterable[str],
+                           max_workers: Optional[int] = None) -> List[PathEntry]:
+        """Provides info for many paths with concurrent INFO commands
+        (one thread per command, without caching).
+
+        HINT: Output is parsed in the caller thread.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        if self._has_direct_funcs_for([FSOperation.INFO]):
+            return self.run_fsops_batch((FSOperation.INFO, path) for path in paths)
+
+        max_workers = min(max_workers or self.INFO_MAX_WORKERS, len(paths))
+        make_command_func, make_result_func = self._fsop_funcs[FSOperation.INFO.value]
+        commands = [make_command_func(path=path) for path in paths]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.shell.run, commands))
+        return [make_result_func(result, path=path)
+                for result, path in zip(results, paths)]
+
+    def infos(self, paths: Iterable[str]) -> List[PathEntry]:
+        """Provides info for many paths with one shell invocation."""
+        paths = [self._normalize_path(path) for path in paths]
+        if self._info_cache is None:
+            return self.info_many(paths)
+
+        cache_keys = [self._make_cache_key(path) for path in paths]
+        path_entries = [self._get_cached_info(cache_key, path)
+                        for cache_key, path in zip(cache_keys, paths)]
+        missed = [index for index, path_entry in enumerate(path_entries)
+                  if path_entry is None]
+        if not missed:
+            return path_entries
+
+        missed_entries = self.info_many([paths[index] for index in missed])
+        for index, path_entry in zip(missed, missed_entries):
+            path_entries[index] = path_entry
+            self._put_cached_info(cache_keys[index], path_entry)
+        return path_entries
+
+    async def ainfo(self, path: str) -> PathEntry:
+        path = self._normalize_path(path)
+        path_entry = self._get_well_known_info(path)
+        if path_entry is not None:
+            return path_entry
+        if self._info_cache is None:
+            return await self.arun_fsop(FSOperation.INFO, path=path)
+
+        cache_key = self._make_cache_key(path)
+        path_entry = self._get_cached_info(cache_key, path)
+        if path_entry is None:
+            path_entry = await self.arun_fsop(FSOperation.INFO, path=path)
+            self._put_cached_info(cache_key, path_entry)
+        return path_entry
+
+    async def ainfos(self, paths: Iterable[str]) -> List[PathEntry]:
+        """Provides info for many paths with concurrent shell invocations.
+
+        HINT: At most :attr:`INFO_MAX_WORKERS` commands run at the same time
+        (each command needs a process and some pipes/file descriptors).
+        """
+        semaphore = asyncio.Semaphore(self.INFO_MAX_WORKERS)
+
+        async def ainfo_limited(path: str) -> PathEntry:
+            async with semaphore:
+                return await self.ainfo(path)
+
+        path_entries = await asyncio.gather(*(ainfo_limited(path) for path in paths))
+        return list(path_entries)
+
+    def info_and_listdir(self, path: str) -> Tuple[PathEntry, Optional[PathEntryBatch]]:
+        """Provides info on a path and its contents (if it is a directory)
+        with one shell invocation.
+
+        :return: Tuple of (path_entry, path_entries or None)
+        """
+        path = self._normalize_path(path)
+        path_entry = self._get_well_known_info(path)
+        if path_entry is not None:
+            return path_entry, self.listdir(path)
+
+        if self._info_cache is not None:
+            cache_key = self._make_cache_key(path)
+            path_entry = self._get_cached_info(cache_key, path)
+            if path_entry is not None:
+                if path_entry["type"] is not PathType.DIRECTORY:
+                    return path_entry, None
+                return path_entry, self.listdir(path)
+            mtime = self._get_listing_mtime(cache_key)
+
+        fsops = [(FSOperation.INFO, path), (FSOperation.LISTDIR, path)]
+        command = self.fsops_command.make_command4info_and_listdir(path)
+        path_entry, path_entries = self.run_fsops_batch(fsops, command=command)
+        if path_entry["type"] is not PathType.DIRECTORY:
+            path_entries = None
+        if self._info_cache is not None:
+            self._put_cached_info(cache_key, path_entry)
+            if path_entries is not None:
+                self._put_cached_listing(cache_key, path_entries, mtime)
+        return path_entry, path_entries
+
+    @property
+    def can_stream_listdir(self) -> bool:
+        """Indicates if :meth:`iter_listdir()` streams the command output."""
+        return (self._listdir_cache is None and
+                self._direct_funcs[FSOperation.LISTDIR.value] is None and
+                hasattr(self.shell, "run_streaming") and
+                hasattr(self.fsops_command, "parse_listdir_lines"))
+
+    def iter_listdir(self, directory: str) -> Iterator[PathEntry]:
+        """Iterate over the contents of a directory while the command runs
+        (without collecting its complete output first).
+
+        Falls back to :meth:`listdir()`, if streaming is not supported.
+
+        :raises subprocess.CalledProcessError: If listdir command has failed.
+        """
+        directory = self._normalize_path(directory)
+        if not self.can_stream_listdir:
+            yield from self.listdir(directory)
+            return
+
+        command = self.fsops_command.make_command4listdir(directory)
+        lines = self.shell.run_streaming(command)
+        yield from self.fsops_command.parse_listdir_lines(lines)
+
+    def listdir(self, directory: str) -> PathEntryBatch:
+        """Lists the contents of a directory.
+
+        HINT: Returned batch may be shared with the cache (treat as read-only).
+        """
+        directory = self._normalize_path(directory)
+        if self._listdir_cache is None:
+            return self.run_fsop(FSOperation.LISTDIR, directory=directory)
+
+        cache_key = self._make_cache_key(directory)
+        path_entries = self._get_cached_listing(cache_key)
+        if path_entries is None:
+            mtime = self._get_listing_mtime(cache_key)
+            path_entries = self.run_fsop(FSOperation.LISTDIR, directory=directory)
+            self._put_cached_listing(cache_key, path_entries, mtime)
+        return path_entries
+
+    async def alistdir(self, directory: str) -> PathEntryBatch:
+        """Async variant of :meth:`listdir()`."""
+        directory = self._normalize_path(directory)
+        if self._listdir_cache is None:
+            return await self.arun_fsop(FSOperation.LISTDIR, directory=directory)
+
+        cache_key = self._make_cache_key(directory)
+        path_entries = self._get_cached_listing(cache_key)
+        if path_entries is None:
+            mtime = self._get_listing_mtime(cache_key)
+            path_entries = await self.arun_fsop(FSOperation.LISTDIR,
+                                                directory=directory)
+            self._put_cached_listing(cache_key, path_entries, mtime)
+        return path_entries
 
     def exists(self, path: str) -> bool:
         path_entry = self.info(path)
         return path_entry["type"] is not PathType.NOT_FOUND
 
+    def exists_fast(self, path: str) -> bool:
+        """Checks if a path exists by using the return code of a command.
+
+        Uses cached info (if available) and falls back to :meth:`exists()`,
+        if the shell dialect provides no EXISTS command.
+        """
+        path = self._normalize_path(path)
+        if path in WELL_KNOWN_DIRECTORIES:
+            return True
+
+        cache_key = None
+        if self._info_cache is not None:
+            cache_key = self._make_cache_key(path)
+            path_entry = self._get_cached_info(cache_key, path)
+            if path_entry is not None:
+                return path_entry["type"] is not PathType.NOT_FOUND
+
+        if not (self._has_direct_funcs_for([FSOperation.EXISTS]) or
+                self.fsops_command.has_command_schema_for(FSOperation.EXISTS)):
+            # -- CASE: Shell dialect provides no EXISTS command.
+            return self.exists(path)
+
+        path_exists = self.run_fsop(FSOperation.EXISTS, path=path)
+        if not path_exists and cache_key is not None:
+            # -- NEGATIVE-LOOKUP: Type of an existing path is unknown (not cached).
+            self._put_cached_info(cache_key, PathEntry.make_not_found(name=path))
+        return path_exists
+
     def isfile(self, path: str) -> bool:
         path_entry = self.info(path)
         return path_entry["type"] is PathType.FILE
@@ -1,5 +1,6 @@
+from .direct import LocalDirectShell as _LocalDirectShell
 from .factory import ShellFactory
-from .unix import UnixShell as _UnixShell
+from .unix import PersistentUnixShell as _PersistentUnixShell
 from .windows import WindowsShell as _WindowsShell
 
 
@@ -7,9 +8,17 @@ from .windows import WindowsShell as _WindowsShell
 # MODULE SETUP
 # -----------------------------------------------------------------------------
 def _register_local_shells_by_platform():
+    if "win32" in ShellFactory.CLASS_REGISTRY:
+        # -- ALREADY REGISTERED: Register shells only once (single registry).
+        return
+
     ShellFactory.register_shell("win32", _WindowsShell)
-    for platform_name in _UnixShell.SUPPORTED_PLATFORMS:
-        ShellFactory.register_shell(platform_name, _UnixShell)
+    # -- HINT: One long-lived shell process (avoids one process per command).
+    # Use UnixShell (one process per command) if process isolation is needed.
+    for platform_name in _PersistentUnixShell.SUPPORTED_PLATFORMS:
+        ShellFactory.register_shell(platform_name, _PersistentUnixShell)
+    # -- OPT-IN: Read-only queries without commands (local filesystem only).
+    ShellFactory.register_shell("local-direct", _LocalDirectShell)
 
 
 def _setup_module():
@@ -0,0 +1,66 @@
+"""
+Provides a local shell that answers read-only queries directly with
+:func:`os.stat()` and :func:`os.scandir()` (without running a command).
+"""
+
+import os
+import stat
+
+from shellfs.core import FSOperation, PathEntry, PathEntryBatch, PathType
+from .unix import PersistentUnixShell
+
+
+class LocalDirectShell(PersistentUnixShell):
+    """
+    Local filesystem shell that provides info, listdir and exists directly
+    (by using system calls instead of ``ls`` or ``stat`` commands).
+    Other (mutating) operations are run as commands in the shell process.
+
+    NOTES:
+
+    * Symbolic links are followed (like: ``ls -L``).
+      Broken symbolic links are not found (and omitted in listings).
+    * Must be requested explicitly, like:
+      ``ShellFileSystem(shell=LocalDirectShell())``
+      or ``ShellFactory.make_shell_by_name("local-direct")``.
+    """
+    DIRECT_FSOPS = (FSOperation.INFO, FSOperation.LISTDIR, FSOperation.EXISTS)
+
+    @staticmethod
+    def _make_path_type(stat_result: os.stat_result) -> PathType:
+        # -- HINT: Regular-file or special-file(s) are mapped to PathType.FILE
+        if stat.S_ISDIR(stat_result.st_mode):
+            return PathType.DIRECTORY
+        return PathType.FILE
+
+    def direct_info(self, path: str) -> PathEntry:
+        name = os.fspath(path)
+        try:
+            stat_result = os.stat(name)
+        except (OSError, ValueError):
+            return PathEntry.make_not_found(name=path)
+        return PathEntry(name=name, type=self._make_path_type(stat_result),
+                         size=stat_result.st_size)
+
+    def direct_listdir(self, directory: str) -> PathEntryBatch:
+        batch = PathEntryBatch()
+        try:
+            with os.scandir(directory) as dir_entries:
+                for dir_entry in dir_entries:
+                    try:
+                        stat_result = dir_entry.stat()
+                    except OSError:
+                        # -- CASE: Broken symbolic link (like: ls -L).
+                        continue
+                    batch.append(dir_entry.name, self._make_path_type(stat_result),
+                                 stat_result.st_size)
+        except NotADirectoryError:
+            # -- SAME AS: ls -l some_file.txt
+            return PathEntryBatch.from_entries([self.direct_info(directory)])
+        except OSError:
+            # -- CASE: Directory is NOT-FOUND.
+            return PathEntryBatch()
+        return batch
+
+    def direct_exists(self, path: str) -> bool:
+        return os.path.exists(path)
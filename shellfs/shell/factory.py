@@ -6,7 +6,7 @@ import sys
 
 from typing_extensions import Self
 
-from shellfs import ShellProtocol
+from shellfs.core import ShellProtocol
 
 
 class ShellFactory:
@@ -1,5 +1,10 @@
+import asyncio
+import os
+import selectors
+import signal
 import subprocess
-from typing import Optional
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 from typing_extensions import ParamSpec
 
 from shellfs.core import CommandResult, ShellProtocol
@@ -11,25 +16,171 @@ from shellfs.core import CommandResult, ShellProtocol
 P = ParamSpec("P")
 
 
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+HAS_POSIX_SPAWN = hasattr(os, "posix_spawnp")
+
+
+# -----------------------------------------------------------------------------
+# UTILITY FUNCTIONS
+# -----------------------------------------------------------------------------
+def exitcode_from_wait_status(status: int) -> int:
+    # -- PROVIDED-BY: os.waitstatus_to_exitcode() since Python 3.9
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
 # -----------------------------------------------------------------------------
 # SHELL IMPLEMENTATION:
 # -----------------------------------------------------------------------------
 class LocalShell(ShellProtocol):
-    """Runs command(s) in the local shell."""
+    """Runs command(s) in the local shell.
+
+    A command, that is provided as argv list, is run without a shell.
+    """
     CHECK_DEFAULT = None
+    IS_LOCAL = True
 
     def __init__(self, check: Optional[bool] = None) -> None:
         super().__init__()
         self.check = check or self.CHECK_DEFAULT
 
-    def run(self, command: str,
+    def run(self, command: Union[str, List[str]],
             timeout: Optional[float] = None,
             **kwargs: P.kwargs) -> CommandResult:
         check = bool(kwargs.pop("check", self.check))
+        use_shell = isinstance(command, str)
         return subprocess.run(command,
                               capture_output=True,
                               timeout=timeout,
                               check=check,
-                              shell=True,
+                              shell=use_shell,
                               **kwargs)
 
+    def run_streaming(self, command: Union[str, List[str]]) -> Iterator[bytes]:
+        """Run a command and provide its output line-by-line (while it runs).
+
+        HINT: Output is not collected (for commands with large outputs).
+
+        :raises subprocess.CalledProcessError: If command has failed (after last line).
+        """
+        use_shell = isinstance(command, str)
+        with subprocess.Popen(command, shell=use_shell,
+                              stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as process:
+            yield from process.stdout
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
+
+    async def arun(self, command: Union[str, List[str]],
+                   timeout: Optional[float] = None) -> CommandResult:
+        """Run a command in a subprocess without blocking the event loop.
+
+        Many commands can be run concurrently (like: with :func:`asyncio.gather()`).
+        """
+        options = dict(stdin=subprocess.DEVNULL,
+                       stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE)
+        if isinstance(command, str):
+            process = await asyncio.create_subprocess_shell(command, **options)
+        else:
+            process = await asyncio.create_subprocess_exec(*command, **options)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(command, timeout)
+
+        result = CommandResult(command, returncode=process.returncode,
+                               stdout=stdout, stderr=stderr)
+        if self.check:
+            result.check_returncode()
+        return result
+
+
+class FastLocalShell(LocalShell):
+    """Runs argv command(s) with :func:`os.posix_spawnp()` and pipes.
+
+    This avoids the per-call overhead of :mod:`subprocess`.
+    Command strings (or extra subprocess options) are run by :class:`LocalShell`.
+    It also falls back to :class:`LocalShell` if ``posix_spawn`` is not
+    supported by the platform (like: Windows).
+    """
+    READ_SIZE = 65536
+
+    def run(self, command: Union[str, List[str]],
+            timeout: Optional[float] = None,
+            **kwargs: P.kwargs) -> CommandResult:
+        if not HAS_POSIX_SPAWN or isinstance(command, str) or kwargs:
+            return super().run(command, timeout=timeout, **kwargs)
+
+        result = self._spawn_and_wait(command, timeout=timeout)
+        if self.check:
+            result.check_returncode()
+        return result
+
+    def _spawn_and_wait(self, argv: Sequence[str],
+                        timeout: Optional[float] = None) -> CommandResult:
+        stdout_fd, stdout_write_fd = os.pipe()
+        stderr_fd, stderr_write_fd = os.pipe()
+        try:
+            # -- HINT: Pipe file descriptors are non-inheritable (close-on-exec).
+            pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, stdout_write_fd, 1),
+                (os.POSIX_SPAWN_DUP2, stderr_write_fd, 2),
+            ])
+        except BaseException:
+            os.close(stdout_fd)
+            os.close(stderr_fd)
+            raise
+        finally:
+            os.close(stdout_write_fd)
+            os.close(stderr_write_fd)
+
+        try:
+            outputs = self._read_until_closed([stdout_fd, stderr_fd], timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise subprocess.TimeoutExpired(argv, timeout)
+        finally:
+            os.close(stdout_fd)
+            os.close(stderr_fd)
+
+        _, status = os.waitpid(pid, 0)
+        return CommandResult(argv, returncode=exitcode_from_wait_status(status),
+                             stdout=outputs[stdout_fd],
+                             stderr=outputs[stderr_fd])
+
+    @classmethod
+    def _read_until_closed(cls, fds: Sequence[int],
+                           timeout: Optional[float] = None) -> Dict[int, bytes]:
+        chunks = {fd: [] for fd in fds}
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        with selectors.DefaultSelector() as selector:
+            for fd in fds:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired("", timeout)
+
+                for key, _ in selector.select(remaining):
+                    data = os.read(key.fd, cls.READ_SIZE)
+                    if data:
+                        chunks[key.fd].append(data)
+                    else:
+                        # -- END-OF-FILE: Write-end was closed.
+                        selector.unregister(key.fd)
+        return {fd: b"".join(parts) for fd, parts in chunks.items()}
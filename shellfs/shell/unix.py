@@ -1,11 +1,24 @@
-from typing import List, Optional
+import os
+import re
+import selectors
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from typing_extensions import ParamSpec
 
-import parse
-from parse_type.cfparse import Parser as CFParser
-
-from shellfs.core import CommandResult, FSOpsCommand, PathEntry, PathType
-from .local import LocalShell
+from shellfs.core import (
+    DEFAULT_ENCODING,
+    CommandResult,
+    FSOperation,
+    FSOpsCommand,
+    PathEntry,
+    PathEntryBatch,
+    PathType,
+)
+from .local import FastLocalShell, LocalShell
 
 # -----------------------------------------------------------------------------
 # TYPE SUPPORT
@@ -16,15 +29,75 @@ P = ParamSpec("P")
 # -----------------------------------------------------------------------------
 # SUPPORT:
 # -----------------------------------------------------------------------------
-# @parse.with_pattern(r"\s*[A-Za-z0-9_:,\-]+")
-@parse.with_pattern(r"\s*([^\s]+)", regex_group_count=1)
-def parse_word(text: str) -> str:
-    return text.strip()
-
-@parse.with_pattern(r"\s+")
-def parse_spacer(text: str) -> str:
-    """One or more whitespace chars."""
-    return text
+# -- FILENAMES: Non-decodable bytes are preserved (like: os.fsdecode()).
+DECODE_ERRORS = "surrogateescape"
+
+# -- FILE-TYPE CHAR (of: ls -l): Other (special) file types are a PathType.FILE
+_FILE_TYPE_MAP = {
+    "-": PathType.FILE,
+    "d": PathType.DIRECTORY,
+    "l": PathType.SYMLINK,
+}
+_FILE_TYPE_MAP4BYTES = {
+    key.encode(DEFAULT_ENCODING): value for key, value in _FILE_TYPE_MAP.items()
+}
+_FILE_TYPE_VALUE_MAP4BYTES = {
+    key: path_type.value for key, path_type in _FILE_TYPE_MAP4BYTES.items()
+}
+
+
+# -- LS LONG-FORMAT LINE (bytes): Compiled once (at module import).
+# SCHEMA: file_type  link_number  user  group  size  timestamp  name
+# SUPPORTED TIMESTAMP(s): ISO-date(time), "Oct 27 11:30", "27 Oct 11:30", epoch-seconds
+# HINT: The timestamp is only matched (not parsed).
+_LS_LINE_RE = re.compile(
+    rb"^(?P<file_type>[-a-zA-Z]\S*)[ \t]+\d+[ \t]+\S+[ \t]+\S+[ \t]+(?P<size>\d+)[ \t]+"
+    rb"(?P<timestamp>\d{4}-\d\d-\d\d(?:[T ]\S+)?"
+    rb"|\S+[ \t]+\d+[ \t]+[\d:]+"
+    rb"|\d+\.?[ \t]+\S+[ \t]+[\d:]+"
+    rb"|\d+)"
+    rb"[ \t]+(?P<name>.+?)[ \t]*$",
+    re.MULTILINE
+)
+
+
+# -- C-QUOTED NAME (of: GNU ls -Q): Like "some \"file\".txt" (bytes).
+_C_ESCAPE_RE = re.compile(rb"\\([0-7]{1,3}|.)", re.DOTALL)
+_C_ESCAPE_MAP = {
+    b"a": b"\a", b"b": b"\b", b"f": b"\f", b"n": b"\n",
+    b"r": b"\r", b"t": b"\t", b"v": b"\v",
+}
+
+
+def _unescape_c_char(matched: "re.Match[bytes]") -> bytes:
+    escaped = matched.group(1)
+    if escaped[:1].isdigit():
+        # -- CASE: Octal escape, like: \351 (for a non-printable byte).
+        return bytes([int(escaped, 8) & 0xFF])
+    return _C_ESCAPE_MAP.get(escaped, escaped)
+
+
+def unquote_c_name(name: bytes) -> bytes:
+    """Remove the C-style quoting of a name (like: ``ls -Q`` provides it)."""
+    if len(name) >= 2 and name.startswith(b'"') and name.endswith(b'"'):
+        name = _C_ESCAPE_RE.sub(_unescape_c_char, name[1:-1])
+    return name
+
+
+# -- STAT DIALECT: Probed once (by sys.platform names).
+_STAT_DIALECT_BY_PLATFORM = {
+    "linux": "gnu",
+    "cygwin": "gnu",
+    "darwin": "bsd",
+    "freebsd": "bsd",
+}
+STAT_DIALECT = _STAT_DIALECT_BY_PLATFORM.get(sys.platform)
+
+# -- STAT FILE-TYPE (lower-case): Other (special) file types are a PathType.FILE
+_STAT_FILE_TYPE_MAP4BYTES = {
+    b"directory": PathType.DIRECTORY,
+    b"symbolic link": PathType.SYMLINK,
+}
 
 
 # -----------------------------------------------------------------------------
@@ -79,8 +152,10 @@ class FSOpsCommand4Unix(FSOpsCommand):
     * https://www.man7.org/linux/man-pages/man1/ls.1.html
     *
     """
+    USE_COMMAND_ARGV = True
     COMMAND_SCHEMA4INFO = "ls -ldAL {path}"         # -- NOTE: Show info on a file or directory (follows symlinks).
     COMMAND_SCHEMA4LISTDIR = "ls -lAL {directory}"  # -- NOTE: List the contents of a directory.
+    COMMAND_SCHEMA4EXISTS = "test -e {path}"        # -- NOTE: Uses only the return code.
     COMMAND_SCHEMA4MAKEDIRS = "mkdir -p {directory}"  # -- NOTE: Creates any missing directories.
     COMMAND_SCHEMA4MKDIR = "mkdir {directory}"      # -- NOTE: May fail if directory exists.
     COMMAND_SCHEMA4TOUCH = "touch {path}"           # -- NOTE: Creates an empty file (or update timestamps).
@@ -88,8 +163,10 @@ class FSOpsCommand4Unix(FSOpsCommand):
     COMMAND_SCHEMA4RMTREE = "rm -rf {directory}"    # -- NOTE: Remove directory-tree recursively.
     COMMAND_SCHEMA4RMDIR = "rmdir {directory}"      # -- NOTE: May fail if non-empty.
     COMMAND_SCHEMA4REMOVE_FILE = "rm -f {path}"     # -- NOTE: Remove file.
-    RESULT_SCHEMA4INFO = "{file_type:Word}{_s0:Spacer}{link_number:d}{_s1:Spacer}{user:w}{_s2:Spacer}{group:w}{_s3:Spacer}{size:d}{_s4:Spacer}{timestamp}{_s5:Spacer}{name:Word}"
+    COMMAND_SCHEMA4INFO_MANY = "ls -ldAL --"        # -- NOTE: Show info on many paths.
     PATH_NOT_FOUND_MARKER = "No such file or directory"
+    _INFO_RE = _LS_LINE_RE     # -- HINT: Derived classes may override it.
+    _PATH_NOT_FOUND_MARKER_BYTES = PATH_NOT_FOUND_MARKER.encode(DEFAULT_ENCODING)
     # NOT_NEEDED: FILE_TYPE_NORMAL_CHARS = "-dl"  # Regular-file, directory, symlink
     # COMMAND_SCHEMA4STAT1A = "ls -ladL -D '%s' {path}"  -- macOS
     # COMMAND_SCHEMA4STAT2A = "ls -ladL --time-style='+%s' {path}"  -- Linux
@@ -102,67 +179,245 @@ class FSOpsCommand4Unix(FSOpsCommand):
             return PathType.NOT_FOUND
 
         first_char = file_type_and_access[0]
-        path_type = PathType.FILE  # Regular-file or special-file(s)
-        if first_char == "d":
-            path_type = PathType.DIRECTORY
-        elif first_char == "l":
-            path_type = PathType.SYMLINK
-        return path_type
+        return _FILE_TYPE_MAP.get(first_char, PathType.FILE)
+
+    @classmethod
+    def _row_to_entry(cls, matched: "re.Match[bytes]") -> PathEntry:
+        file_type_and_access, size, name = matched.group("file_type", "size", "name")
+        # -- HINT: Regular-file or special-file(s) are mapped to PathType.FILE
+        path_type = _FILE_TYPE_MAP4BYTES.get(file_type_and_access[:1], PathType.FILE)
+        name = name.decode(DEFAULT_ENCODING, DECODE_ERRORS)
+        return PathEntry(name=name, type=path_type, size=int(size))
 
     @classmethod
-    def parse_info(cls, text: str, path: Optional[str] = None) -> PathEntry:
-        if cls.PATH_NOT_FOUND_MARKER in text:
+    def parse_info(cls, text: Union[bytes, str], path: Optional[str] = None) -> PathEntry:
+        if isinstance(text, str):
+            text = text.encode(DEFAULT_ENCODING)
+        if cls._PATH_NOT_FOUND_MARKER_BYTES in text:
             return PathEntry.make_not_found(name=path)
 
-        schema = cls.RESULT_SCHEMA4INFO
-        more_types = dict(Word=parse_word, Spacer=parse_spacer)
-        parser = CFParser(schema, extra_types=more_types)
-        matched = parser.parse(text)
+        matched = cls._INFO_RE.match(text)
         if matched:
-            file_type_and_access = matched.named["file_type"]
-            path_type = cls.get_file_type_from(file_type_and_access)
-            name = matched.named["name"]
-            size = matched.named["size"]
-            return PathEntry(name=name, type=path_type, size=size)
+            return cls._row_to_entry(matched)
 
         # -- OTHERWISE: Mismatched, unexpected output.
         return PathEntry.make_not_found(name=path)
 
+    @classmethod
+    def parse_listdir_lines(cls, lines: Iterable[bytes]) -> Iterator[PathEntry]:
+        """Parse the output of a listdir command line-by-line (streaming)."""
+        for line in lines:
+            if line.startswith(b"total "):
+                # -- HEADER: If path is a directory.
+                continue
+
+            matched = cls._INFO_RE.match(line)
+            if matched:
+                yield cls._row_to_entry(matched)
+
     # -- IMPLEMENT INTERFACE FOR: FSOpsCommand
+    def make_command4info_and_listdir(self, path: str) -> str:
+        # -- HINT: Skip listdir for a file or missing path ("test" is a shell builtin).
+        info_command = self._make_shell_command_for(FSOperation.INFO, path)
+        listdir_command = self._make_shell_command_for(FSOperation.LISTDIR, path)
+        quoted_path = shlex.quote(os.fspath(path))
+        return self.join_commands([
+            info_command,
+            f"test -d {quoted_path} && {listdir_command}",
+        ])
+
     @classmethod
     def make_result4info(cls, result: CommandResult, path: str) -> PathEntry:
         if result.returncode != 0:
             return PathEntry.make_not_found(name=path)
 
-        output = result.stdout.strip()
-        if isinstance(output, bytes):
-            output = output.decode("utf-8")
-        return cls.parse_info(output, path=path)
+        # -- HINT: _INFO_RE tolerates trailing whitespace (strip() is not needed).
+        return cls.parse_info(result.stdout, path=path)
 
     @classmethod
-    def make_result4listdir(cls, result: CommandResult, directory: str) -> List[PathEntry]:
-        output = result.stdout.strip()
-        if isinstance(output, bytes):
-            output = output.decode("utf-8")
+    def make_result4info_many(cls, result: CommandResult,
+                              paths: List[str]) -> List[Optional[PathEntry]]:
+        # -- HINT: ls sorts its output and shows each name as provided.
+        # Missing paths are only reported on stderr.
+        output = result.stdout
+        if isinstance(output, str):
+            output = output.encode(DEFAULT_ENCODING)
+
+        path_entries = [cls._row_to_entry(matched)
+                        for matched in cls._INFO_RE.finditer(output)]
+        return cls._map_path_entries_to_paths(path_entries, paths)
+
+    @staticmethod
+    def _map_path_entries_to_paths(path_entries: List[Optional[PathEntry]],
+                                   paths: List[str]) -> List[Optional[PathEntry]]:
+        """Map path entries back to paths by name (None: for an unmatched row)."""
+        entries_by_name = {path_entry["name"]: path_entry
+                           for path_entry in path_entries if path_entry is not None}
+        path_names = [os.fspath(path) for path in paths]
+        # -- CASE: Output rows without a matching path (like: unusual names).
+        # Then a missing path can not be distinguished from an unmapped path.
+        has_unmapped_rows = (any(path_entry is None for path_entry in path_entries) or
+                             not entries_by_name.keys() <= set(path_names))
+        mapped_entries = []
+        for path, name in zip(paths, path_names):
+            path_entry = entries_by_name.get(name)
+            if path_entry is None and not has_unmapped_rows:
+                path_entry = PathEntry.make_not_found(name=path)
+            mapped_entries.append(path_entry)
+        return mapped_entries
 
-        if cls.PATH_NOT_FOUND_MARKER in output:
+    @classmethod
+    def make_result4listdir(cls, result: CommandResult, directory: str) -> PathEntryBatch:
+        output = result.stdout
+        if isinstance(output, str):
+            output = output.encode(DEFAULT_ENCODING)
+
+        # -- HINT: ls provides an error or the "total ..." header only as first line.
+        first_line_end = output.find(b"\n")
+        first_line = output if first_line_end < 0 else output[:first_line_end]
+        if cls._PATH_NOT_FOUND_MARKER_BYTES in first_line:
             # -- SPECIAL CASE: path is NOT-FOUND (use case: is not really used).
             # MAYBE: return [PathEntry.make_not_found(path)]
-            return []
+            return PathEntryBatch()
+
+        # -- NORMAL-CASE: Skip over the first line "total ...".
+        # HINT: Columns are built at once (without append() calls per entry).
+        start = 0
+        if first_line.startswith(b"total "):
+            start = first_line_end + 1
+        rows = [matched.group("file_type", "size", "name")
+                for matched in cls._INFO_RE.finditer(output, start)]
+        if not rows:
+            return PathEntryBatch()
+
+        file_types, sizes, names = zip(*rows)
+        file_type_value_map = _FILE_TYPE_VALUE_MAP4BYTES
+        file_type_value = PathType.FILE.value
+        return PathEntryBatch(
+            names=[name.decode(DEFAULT_ENCODING, DECODE_ERRORS) for name in names],
+            type_values=[file_type_value_map.get(file_type_and_access[:1], file_type_value)
+                         for file_type_and_access in file_types],
+            sizes=map(int, sizes),
+        )
+
+
+class FSOpsCommand4UnixStat(FSOpsCommand4Unix):
+    """
+    Uses ``stat`` with a fixed output format to provide info on paths.
+    This avoids the locale-dependent timestamp formats of ``ls``.
+    Other operations (like: listdir) are inherited from :class:`FSOpsCommand4Unix`.
 
-        selected = []
-        for index, line in enumerate(output.splitlines()):
-            if index == 0 and line.startswith("total "):
-                # -- FIRST LINE: If path is a directory.
-                continue
+    EXAMPLES:
+
+    .. code-block:: bash
+
+        # -- GNU stat (linux, cygwin):
+        $ stat -L -c '%F|%s|%Y|%n' this_repo_directory this_file.txt
+        directory|4096|1730027943|this_repo_directory
+        regular file|2879|1730025034|this_file.txt
+
+        # -- BSD stat (darwin, freebsd):
+        $ stat -L -f '%HT|%z|%m|%N' this_repo_directory this_file.txt
+        Directory|320|1730027943|this_repo_directory
+        Regular File|2879|1730025034|this_file.txt
+        # file_type|size|modified-time (epoch-seconds)|name
+    """
+    STAT_COMMAND_BY_DIALECT = {
+        "gnu": "stat -L -c '%F|%s|%Y|%n'",
+        "bsd": "stat -L -f '%HT|%z|%m|%N'",
+    }
+    STAT_COMMAND = STAT_COMMAND_BY_DIALECT[STAT_DIALECT or "gnu"]
+    COMMAND_SCHEMA4INFO = STAT_COMMAND + " {path}"
+    COMMAND_SCHEMA4INFO_MANY = STAT_COMMAND + " --"
+
+    @classmethod
+    def parse_stat_line(cls, line: bytes) -> Optional[PathEntry]:
+        # -- SCHEMA: file_type|size|mtime|name (name may contain "|").
+        parts = line.split(b"|", 3)
+        if len(parts) != 4 or not parts[1].isdigit():
+            # -- OTHERWISE: Mismatched, unexpected output.
+            return None
+
+        file_type, size, _, name = parts
+        path_type = _STAT_FILE_TYPE_MAP4BYTES.get(file_type.lower(), PathType.FILE)
+        return PathEntry(name=name.decode(DEFAULT_ENCODING, DECODE_ERRORS),
+                         type=path_type, size=int(size))
+
+    # -- IMPLEMENT INTERFACE FOR: FSOpsCommand
+    @classmethod
+    def make_result4info(cls, result: CommandResult, path: str) -> PathEntry:
+        if result.returncode != 0:
+            return PathEntry.make_not_found(name=path)
+
+        output = result.stdout
+        if isinstance(output, str):
+            output = output.encode(DEFAULT_ENCODING)
+        # -- HINT: Only the final newline is removed (name may contain newlines).
+        path_entry = cls.parse_stat_line(output[:-1] if output.endswith(b"\n") else output)
+        if path_entry is None:
+            return PathEntry.make_not_found(name=path)
+        return path_entry
+
+    @classmethod
+    def make_result4info_many(cls, result: CommandResult,
+                              paths: List[str]) -> List[Optional[PathEntry]]:
+        # -- HINT: stat shows each name as provided (in the same order).
+        # Missing paths are only reported on stderr.
+        output = result.stdout
+        if isinstance(output, str):
+            output = output.encode(DEFAULT_ENCODING)
+
+        path_entries = [cls.parse_stat_line(line) for line in output.splitlines()]
+        return cls._map_path_entries_to_paths(path_entries, paths)
+
+
+class FSOpsCommand4UnixGNU(FSOpsCommand4UnixStat):
+    """
+    Uses GNU ``ls -Q`` to provide info on many paths with one command.
+    The names are C-quoted, like: ``"some file\\nwith newline.txt"``.
+    Therefore, names with spaces, newlines, ... are parsed unambiguously
+    (``stat`` output is line-based and provides each name unquoted).
+
+    EXAMPLES:
+
+    .. code-block:: bash
+
+        $ ls -ldAL -Q -- this_repo_directory "this file.txt"
+        drwxr-xr-x 10 alice users  320 Oct 27 12:19 "this_repo_directory"
+        -rw-r--r--  1 alice users 2879 Oct 27 11:30 "this file.txt"
+    """
+    COMMAND_SCHEMA4INFO_MANY = "ls -ldAL -Q --"
+
+    @classmethod
+    def _row_to_quoted_entry(cls, matched: "re.Match[bytes]") -> PathEntry:
+        file_type_and_access, size, name = matched.group("file_type", "size", "name")
+        path_type = _FILE_TYPE_MAP4BYTES.get(file_type_and_access[:1], PathType.FILE)
+        name = unquote_c_name(name).decode(DEFAULT_ENCODING, DECODE_ERRORS)
+        return PathEntry(name=name, type=path_type, size=int(size))
+
+    # -- IMPLEMENT INTERFACE FOR: FSOpsCommand
+    @classmethod
+    def make_result4info_many(cls, result: CommandResult,
+                              paths: List[str]) -> List[Optional[PathEntry]]:
+        # -- HINT: ls sorts its output (names are mapped back to the paths).
+        # Missing paths are only reported on stderr.
+        output = result.stdout
+        if isinstance(output, str):
+            output = output.encode(DEFAULT_ENCODING)
+
+        path_entries = [cls._row_to_quoted_entry(matched)
+                        for matched in cls._INFO_RE.finditer(output)]
+        return cls._map_path_entries_to_paths(path_entries, paths)
 
-            path_entry = cls.parse_info(line, path=directory)
-            assert path_entry["type"] is not PathType.NOT_FOUND
-            selected.append(path_entry)
-        return selected
 
+# -- HINT: Use ls-based FSOpsCommand4Unix if the stat dialect is unknown.
+_FSOPS_COMMAND_CLASS_BY_STAT_DIALECT = {
+    "gnu": FSOpsCommand4UnixGNU,
+    "bsd": FSOpsCommand4UnixStat,
+}
 
-class UnixShell(LocalShell):
+
+class UnixShell(FastLocalShell):
     """
     Filesystem shell for UNIX-like shells (Bourne shell, bash, ...).
 
@@ -176,4 +431,180 @@ class UnixShell(LocalShell):
     """
     # -- BASED-ON: sys.platform names
     SUPPORTED_PLATFORMS = ["darwin", "linux", "aix", "cygwin", "freebsd"]
-    FSOPS_COMMAND_CLASS = FSOpsCommand4Unix
+    FSOPS_COMMAND_CLASS = _FSOPS_COMMAND_CLASS_BY_STAT_DIALECT.get(STAT_DIALECT,
+                                                                   FSOpsCommand4Unix)
+
+
+class PersistentUnixShell(LocalShell):
+    """
+    Filesystem shell that runs all command(s) in one long-lived ``/bin/sh``
+    process (co-process) instead of spawning a new process for each command.
+
+    Each command is written to the stdin of the shell process.
+    An end-marker with the return code is written to stdout (and stderr)
+    after each command.
+
+    NOTES:
+
+    * The shell process is started on the first command (lazy).
+    * Only one command runs in the shell process at a time.
+      Concurrent commands (from other threads) are run in a new process.
+    * The current working directory of the caller is used for each command.
+    * Environment changes of the caller are not seen by a running shell process.
+    * Use :class:`UnixShell` if process isolation per command is needed.
+    """
+    SUPPORTED_PLATFORMS = UnixShell.SUPPORTED_PLATFORMS
+    FSOPS_COMMAND_CLASS = UnixShell.FSOPS_COMMAND_CLASS
+    SHELL_ARGV = ["/bin/sh"]
+    END_MARKER = b"\x00SHELLFS-END:"
+    END_MARKER_PATTERN = re.compile(rb"\x00SHELLFS-END:(\d*)\x00$")
+    READ_SIZE = 65536
+
+    def __init__(self, check: Optional[bool] = None) -> None:
+        super().__init__(check=check)
+        self._lock = threading.Lock()
+        self._cwd = None
+        self._process = None
+
+    def __del__(self) -> None:
+        if getattr(self, "_process", None) is not None:
+            self.close()
+
+    def _start_process(self) -> subprocess.Popen:
+        self._cwd = None
+        return subprocess.Popen(self.SHELL_ARGV,
+                                stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                bufsize=0)
+
+    def close(self) -> None:
+        """Terminate the shell process."""
+        with self._lock:
+            process, self._process = self._process, None
+            if process is None:
+                return
+            self._stop_process(process)
+
+    @staticmethod
+    def _stop_process(process: subprocess.Popen) -> None:
+        try:
+            process.stdin.close()
+            process.wait(timeout=1.0)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+            process.stderr.close()
+
+    def _make_script(self, command: str) -> bytes:
+        lines = []
+        cwd = os.getcwd()
+        if cwd != self._cwd:
+            lines.append(f"cd -- {shlex.quote(cwd)}")
+            self._cwd = cwd
+        # -- HINT: Command must not consume the (script) stdin of the shell.
+        # Command runs in a subshell: Its "cd", "set -e", "exec", "exit", ...
+        # do not change the long-lived shell (or later commands).
+        lines.extend([
+            "(",
+            command,
+            ") </dev/null",
+            "printf '\\000SHELLFS-END:%d\\000' $?",
+            "printf '\\000SHELLFS-END:\\000' >&2",
+            "",
+        ])
+        # -- HINT: Non-decodable bytes of paths (and: cwd) are restored (like: os.fsencode()).
+        return "\n".join(lines).encode(DEFAULT_ENCODING, DECODE_ERRORS)
+
+    def run(self, command: Union[str, List[str]],
+            timeout: Optional[float] = None,
+            **kwargs: P.kwargs) -> CommandResult:
+        if kwargs:
+            # -- CASE: Extra subprocess options are only supported by LocalShell.
+            return super().run(command, timeout=timeout, **kwargs)
+
+        command_text = command
+        if not isinstance(command, str):
+            command_text = shlex.join(command)
+
+        if not self._lock.acquire(blocking=False):
+            # -- CASE: Shell process is busy (used by another thread).
+            # Run the command in a new process (instead of waiting).
+            return super().run(command, timeout=timeout)
+
+        try:
+            if self._process is None or self._process.poll() is not None:
+                self._process = self._start_process()
+            result = self._run_in_process(command, command_text, timeout=timeout)
+        finally:
+            self._lock.release()
+
+        if self.check:
+            result.check_returncode()
+        return result
+
+    def _run_in_process(self, command: Union[str, List[str]], command_text: str,
+                        timeout: Optional[float] = None) -> CommandResult:
+        process = self._process
+        try:
+            process.stdin.write(self._make_script(command_text))
+            stdout, stderr, return_code = self._read_until_end_markers(process,
+                                                                       timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # -- STATE OF SHELL IS UNKNOWN: Start a new one next time.
+            process.kill()
+            self._stop_process(process)
+            self._process = None
+            raise subprocess.TimeoutExpired(command, timeout)
+        except BrokenPipeError:
+            stdout, stderr, return_code = b"", b"", None
+
+        if return_code is None:
+            # -- CASE: Shell process has died (EOF before end-marker).
+            return_code = process.wait()
+            self._stop_process(process)
+            self._process = None
+        return CommandResult(command, returncode=return_code,
+                             stdout=stdout, stderr=stderr)
+
+    def _read_until_end_markers(self, process: subprocess.Popen,
+                                timeout: Optional[float] = None
+                                ) -> Tuple[bytes, bytes, Optional[int]]:
+        stdout_fd = process.stdout.fileno()
+        stderr_fd = process.stderr.fileno()
+        buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        with selectors.DefaultSelector() as selector:
+            for fd in buffers:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired("", timeout)
+
+                for key, _ in selector.select(remaining):
+                    data = os.read(key.fd, self.READ_SIZE)
+                    buffer = buffers[key.fd]
+                    buffer.extend(data)
+                    if not data or self.END_MARKER_PATTERN.search(buffer[-32:]):
+                        selector.unregister(key.fd)
+
+        stdout, return_code = self._split_end_marker(bytes(buffers[stdout_fd]))
+        stderr, _ = self._split_end_marker(bytes(buffers[stderr_fd]))
+        return stdout, stderr, return_code
+
+    @classmethod
+    def _split_end_marker(cls, output: bytes) -> Tuple[bytes, Optional[int]]:
+        matched = cls.END_MARKER_PATTERN.search(output[-32:])
+        if not matched:
+            return output, None
+        return_code = matched.group(1)
+        output = output[:output.rindex(cls.END_MARKER)]
+        return output, int(return_code) if return_code else None
@@ -11,14 +11,17 @@ MISSING SUPPORT FOR FILESYSTEM:
 * ... (like: cat(), ...)
 """
 
+from subprocess import CalledProcessError
 from typing import Optional
 from typing_extensions import ParamSpec
 
+from fsspec.asyn import AsyncFileSystem
 from fsspec.spec import AbstractFileSystem
 
 from shellfs.core import (
     CommandResult,
     FileSystemProtocol,
+    PathEntryBatch,
     PathType,
     ShellProtocol,
     # PREPARED: as_string,
@@ -34,6 +37,17 @@ P = ParamSpec("P")
 # -----------------------------------------------------------------------------
 # FILESYSTEM SUPPORT
 # -----------------------------------------------------------------------------
+def make_fs_protocol(shell: ShellProtocol, **kwargs: P.kwargs) -> FileSystemProtocol:
+    """Make the :class:`FileSystemProtocol` with the cache options from kwargs."""
+    cache_options = {name: value for name, value in kwargs.items()
+                     if name in FileSystemProtocol.CACHE_OPTION_NAMES}
+    if shell.DIRECT_FSOPS:
+        # -- DIRECT SHELL: Queries are cheap system calls (without commands).
+        # Caching them is not needed (and would only provide stale results).
+        cache_options.setdefault("use_listings_cache", False)
+    return FileSystemProtocol(shell, **cache_options)
+
+
 class ShellFileSystem(AbstractFileSystem):
     def __init__(self, shell: Optional[ShellProtocol] = None, **kwargs: P.kwargs) -> None:
         if shell is None:
@@ -41,7 +55,7 @@ class ShellFileSystem(AbstractFileSystem):
 
         super().__init__(**kwargs)
         self.shell = shell
-        self.fs_protocol = FileSystemProtocol(shell)
+        self.fs_protocol = make_fs_protocol(shell, **kwargs)
 
     @staticmethod
     def _raise_error_on_command_failed(result: CommandResult,
@@ -78,7 +92,23 @@ class ShellFileSystem(AbstractFileSystem):
             raise FileNotFoundError(path)
         return path_entry
 
-    def ls(self, path, detail=True, **kwargs):
+    def _info_many(self, paths):
+        """Provides info for many paths with one shell invocation.
+
+        HINT: Missing paths are not raised as error (use: PathType.NOT_FOUND).
+        """
+        paths = [self._strip_protocol(path) for path in paths]
+        return self.fs_protocol.infos(paths)
+
+    def exists_many(self, paths):
+        """Checks if many paths exist with one shell invocation.
+
+        :return: List of bools (one for each path, same order as paths).
+        """
+        return [path_entry["type"] is not PathType.NOT_FOUND
+                for path_entry in self._info_many(paths)]
+
+    def ls(self, path, detail=True, refresh=False, _hint_type=None, **kwargs):
         """List objects at path.
 
         This should include subdirectories and files at that location. The
@@ -109,6 +139,12 @@ class ShellFileSystem(AbstractFileSystem):
             if True, gives a list of dictionaries, where each is the same as
             the result of ``info(path)``. If False, gives a list of paths
             (str).
+        refresh: bool
+            If True, discard cached info/listing for this path first.
+        _hint_type: PathType, optional
+            INTERNAL: Caller guarantees the type of the (stripped) path
+            (like: walk() for a sub-directory of a parent listing).
+            Avoids the info on the path for PathType.DIRECTORY.
         kwargs: may have additional backend-specific options, such as version
             information
 
@@ -117,26 +153,123 @@ class ShellFileSystem(AbstractFileSystem):
         List of strings if detail is False, or list of directory information
         dicts if detail is True.
         """
-        path = self._strip_protocol(path)
-        path_entry = self.info(path)
-        if path_entry["type"] is PathType.NOT_FOUND:
-            raise FileNotFoundError(path)
-
-        if path_entry["type"] == PathType.DIRECTORY:
+        if _hint_type is not PathType.DIRECTORY:
+            path = self._strip_protocol(path)
+        if refresh:
+            self.fs_protocol.invalidate_cache(path)
+        if not detail and self.fs_protocol.can_stream_listdir:
+            return self._ls_names_streamed(path)
+
+        # -- HINT: Listing is cached and also provides info on its entries.
+        if _hint_type is PathType.DIRECTORY:
             path_entries = self.fs_protocol.listdir(path)
         else:
-            assert path_entry["type"] == PathType.FILE
-            path_entries = [path_entry]
+            path_entry, path_entries = self.fs_protocol.info_and_listdir(path)
+        if path_entries is None:
+            # -- CASE: Path is not a directory (path_entries are only provided for it).
+            if path_entry["type"] is PathType.NOT_FOUND:
+                raise FileNotFoundError(path)
+            path_entries = PathEntryBatch.from_entries([path_entry])
 
         if not detail:
-            # -- NAME-ONLY:
-            return [entry["name"] for entry in path_entries]
+            # -- NAME-ONLY: Copy it (batch may be shared with the cache).
+            return list(path_entries.names)
         # -- OTHERWISE: Provide complete info for each entry.
-        return path_entries
+        return path_entries.as_entries()
+
+    def _ls_names_streamed(self, path):
+        """Provides the names of directory entries from the streamed listdir output.
+
+        HINT: Used without listings cache (for very large directories).
+        """
+        names = []
+        try:
+            for path_entry in self.fs_protocol.iter_listdir(path):
+                names.append(path_entry["name"])
+        except CalledProcessError:
+            # -- CASE: Missing path and/or some entries were not accessible.
+            if not names and not self.fs_protocol.exists(path):
+                raise FileNotFoundError(path)
+        return names
+
+    def walk(self, path, maxdepth=None, topdown=True, on_error="omit", **kwargs):
+        """Return all files under the given path (like: :func:`os.walk()`).
+
+        Same as :meth:`AbstractFileSystem.walk()`, but the type of each
+        sub-directory is already known from the listing of its parent
+        (so ``ls()`` needs no info on it).
+        """
+        if maxdepth is not None and maxdepth < 1:
+            raise ValueError("maxdepth must be at least 1")
+
+        path = self._strip_protocol(path)
+        yield from self._walk(path, maxdepth, topdown, on_error, **kwargs)
+
+    def _walk(self, path, maxdepth, topdown, on_error, _hint_type=None, **kwargs):
+        detail = kwargs.pop("detail", False)
+        try:
+            listing = self.ls(path, detail=True, _hint_type=_hint_type, **kwargs)
+        except (FileNotFoundError, OSError) as e:
+            if on_error == "raise":
+                raise
+            if callable(on_error):
+                on_error(e)
+            return
+
+        full_dirs = {}
+        dirs = {}
+        files = {}
+        for info in listing:
+            name = info["name"].rstrip("/").rsplit("/", 1)[-1]
+            if info["type"] is PathType.DIRECTORY:
+                full_dirs[name] = "/".join([path.rstrip("/"), name])
+                dirs[name] = info
+            elif info["name"] == path:
+                # -- CASE: File-like path (listing contains only this path).
+                files[""] = info
+            else:
+                files[name] = info
+
+        if not detail:
+            dirs = list(dirs)
+            files = list(files)
+
+        if topdown:
+            # -- YIELD BEFORE RECURSION: If walking top down.
+            yield path, dirs, files
+
+        if maxdepth is not None:
+            maxdepth -= 1
+            if maxdepth < 1:
+                if not topdown:
+                    yield path, dirs, files
+                return
+
+        for name in dirs:
+            yield from self._walk(full_dirs[name], maxdepth, topdown, on_error,
+                                  _hint_type=PathType.DIRECTORY,
+                                  detail=detail, **kwargs)
+
+        if not topdown:
+            # -- YIELD AFTER RECURSION: If walking bottom up.
+            yield path, dirs, files
+
+    def invalidate_cache(self, path=None):
+        """Discard cached info/listings for a path (or all: if path is None).
+
+        Needed if the filesystem was changed by others (not by this instance).
+        """
+        if path is not None:
+            path = self._strip_protocol(path)
+        self.fs_protocol.invalidate_cache(path)
+        super().invalidate_cache(path)
+
+    invalidate = invalidate_cache
 
-    # TODO: Check if needed.
     def exists(self, path, **kwargs):
-        return self.fs_protocol.exists(path)
+        # -- HINT: Uses the return code of "test -e" (without info parsing).
+        path = self._strip_protocol(path)
+        return self.fs_protocol.exists_fast(path)
 
     def mkdir(self, path, create_parents=True, **kwargs):
         """
@@ -261,9 +394,10 @@ class ShellFileSystem(AbstractFileSystem):
         if not isinstance(paths, list):
             paths = [path]
 
-        for this_path in paths:
-            this_path = self._strip_protocol(this_path)
-            path_type = self.fs_protocol.info(this_path)["type"]
+        paths = [self._strip_protocol(this_path) for this_path in paths]
+        path_entries = self._info_many(paths)
+        for this_path, path_entry in zip(paths, path_entries):
+            path_type = path_entry["type"]
             if path_type is PathType.NOT_FOUND:
                 # -- GRACEFULLY-IGNORED
                 continue
@@ -313,3 +447,64 @@ class ShellFileSystem(AbstractFileSystem):
         errno = result.returncode
         output = CommandResult.make_output(result)
         raise OSError(errno, output, directory)
+
+
+class AsyncShellFileSystem(AsyncFileSystem):
+    """Async variant of :class:`ShellFileSystem` (for read-only operations).
+
+    Shell commands for many paths are run concurrently, like:
+
+    .. code-block:: python
+
+        fs = AsyncShellFileSystem(asynchronous=True)
+        path_entries = await fs._info_many(["file1.txt", "file2.txt"])
+    """
+    def __init__(self, shell: Optional[ShellProtocol] = None, **kwargs: P.kwargs) -> None:
+        if shell is None:
+            shell = ShellFactory.make_local_shell()
+
+        super().__init__(**kwargs)
+        self.shell = shell
+        self.fs_protocol = make_fs_protocol(shell, **kwargs)
+
+    # -- IMPLEMENT INTERFACE FOR: AsyncFileSystem
+    @property
+    def fsid(self):
+        return "shellfs"
+
+    async def _info(self, path, **kwargs):
+        path = self._strip_protocol(path)
+        path_entry = await self.fs_protocol.ainfo(path)
+        if path_entry["type"] is PathType.NOT_FOUND:
+            raise FileNotFoundError(path)
+        return path_entry
+
+    async def _info_many(self, paths):
+        """Provides info for many paths with concurrent shell invocations.
+
+        HINT: Missing paths are not raised as error (use: PathType.NOT_FOUND).
+        """
+        paths = [self._strip_protocol(path) for path in paths]
+        return await self.fs_protocol.ainfos(paths)
+
+    async def _ls(self, path, detail=True, **kwargs):
+        path = self._strip_protocol(path)
+        path_entry = await self.fs_protocol.ainfo(path)
+        path_type = path_entry["type"]
+        if path_type is PathType.NOT_FOUND:
+            raise FileNotFoundError(path)
+
+        if path_type is PathType.DIRECTORY:
+            path_entries = await self.fs_protocol.alistdir(path)
+        else:
+            path_entries = PathEntryBatch.from_entries([path_entry])
+
+        if not detail:
+            # -- NAME-ONLY: Copy it (batch may be shared with the cache).
+            return list(path_entries.names)
+        return path_entries.as_entries()
+
+    async def _exists(self, path, **kwargs):
+        path = self._strip_protocol(path)
+        path_entry = await self.fs_protocol.ainfo(path)
+        return path_entry["type"] is not PathType.NOT_FOUND
@@ -0,0 +1,66 @@
+from operator import itemgetter
+
+import pytest
+
+from shellfs.core import FileSystemProtocol, PathEntry, PathType
+from shellfs.shell.direct import LocalDirectShell
+
+
+# -----------------------------------------------------------------------------
+# TEST SUPPORT:
+# -----------------------------------------------------------------------------
+class CountingLocalDirectShell(LocalDirectShell):
+    """Records the commands that were run."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.commands = []
+
+    def run(self, command, timeout=None, **kwargs):
+        self.commands.append(command)
+        return super().run(command, timeout=timeout, **kwargs)
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
+class TestLocalDirectShell:
+    @pytest.fixture
+    def shell(self):
+        this_shell = CountingLocalDirectShell()
+        yield this_shell
+        this_shell.close()
+
+    def test_direct_info_with_file(self, shell, tmp_path) -> None:
+        this_path = tmp_path/"some_file.txt"
+        this_path.write_text("SOME TEXT")
+        path_entry = shell.direct_info(str(this_path))
+        assert path_entry == PathEntry(name=str(this_path), type=PathType.FILE, size=9)
+
+    def test_direct_info_with_missing_path(self, shell, tmp_path) -> None:
+        this_path = tmp_path/"MISSING_FILE.txt"
+        path_entry = shell.direct_info(str(this_path))
+        assert path_entry["type"] is PathType.NOT_FOUND
+
+    def test_direct_listdir_follows_symlinks(self, shell, tmp_path) -> None:
+        (tmp_path/"some_directory").mkdir()
+        (tmp_path/"some_file.txt").write_text("SOME TEXT")
+        (tmp_path/"some_link").symlink_to(tmp_path/"some_directory")
+        (tmp_path/"broken_link").symlink_to(tmp_path/"MISSING_FILE.txt")
+        path_entries = shell.direct_listdir(str(tmp_path))
+        assert sorted(path_entries.as_entries(), key=itemgetter("name")) == [
+            PathEntry(name="some_directory", type=PathType.DIRECTORY, size=None),
+            PathEntry(name="some_file.txt", type=PathType.FILE, size=9),
+            PathEntry(name="some_link", type=PathType.DIRECTORY, size=None),
+        ]
+
+    def test_fs_protocol_runs_no_command_for_queries(self, shell, tmp_path) -> None:
+        this_path = tmp_path/"some_file.txt"
+        fs_protocol = FileSystemProtocol(shell)
+        assert fs_protocol.exists_fast(this_path) is False
+        fs_protocol.touch(this_path)
+        assert fs_protocol.isfile(this_path) is True
+        path_entry, path_entries = fs_protocol.info_and_listdir(tmp_path)
+        assert path_entry["type"] is PathType.DIRECTORY
+        assert path_entries.names == ["some_file.txt"]
+        assert shell.commands == [["touch", str(this_path)]]
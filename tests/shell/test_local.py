@@ -0,0 +1,88 @@
+import asyncio
+import subprocess
+
+import pytest
+
+from shellfs.core import FSOpsCommand
+from shellfs.shell.local import FastLocalShell, LocalShell
+
+
+# -----------------------------------------------------------------------------
+# TEST SUPPORT:
+# -----------------------------------------------------------------------------
+class ThisLocalShell(LocalShell):
+    FSOPS_COMMAND_CLASS = FSOpsCommand
+
+
+class ThisFastLocalShell(FastLocalShell):
+    FSOPS_COMMAND_CLASS = FSOpsCommand
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
+class TestFastLocalShell:
+    def test_run_with_argv_captures_stdout(self) -> None:
+        shell = ThisFastLocalShell()
+        result = shell.run(["echo", "Hello World"])
+        assert result.returncode == 0
+        assert result.stdout == b"Hello World\n"
+        assert result.stderr == b""
+
+    def test_run_with_argv_captures_stderr_and_return_code(self, tmp_path) -> None:
+        this_path = tmp_path/"MISSING_FILE.txt"
+        shell = ThisFastLocalShell()
+        result = shell.run(["ls", "-ld", str(this_path)])
+        assert result.returncode != 0
+        assert result.stdout == b""
+        assert b"No such file or directory" in result.stderr
+
+    def test_run_with_command_string_uses_shell(self) -> None:
+        shell = ThisFastLocalShell()
+        result = shell.run("echo one; echo two")
+        assert result.returncode == 0
+        assert result.stdout == b"one\ntwo\n"
+
+    def test_run_raises_timeout_error(self) -> None:
+        shell = ThisFastLocalShell()
+        with pytest.raises(subprocess.TimeoutExpired):
+            shell.run(["sleep", "5"], timeout=0.1)
+
+    def test_run_provides_same_result_as_local_shell(self) -> None:
+        command = ["ls", "-lA", "/"]
+        result1 = ThisFastLocalShell().run(command)
+        result2 = ThisLocalShell().run(command)
+        assert result1.returncode == result2.returncode
+        assert result1.stdout == result2.stdout
+
+
+class TestLocalShell:
+    def test_arun_with_argv_captures_stdout(self) -> None:
+        shell = ThisLocalShell()
+        result = asyncio.run(shell.arun(["echo", "Hello World"]))
+        assert result.returncode == 0
+        assert result.stdout == b"Hello World\n"
+
+    def test_arun_with_command_string_uses_shell(self) -> None:
+        shell = ThisLocalShell()
+        result = asyncio.run(shell.arun("echo one; exit 3"))
+        assert result.returncode == 3
+        assert result.stdout == b"one\n"
+
+    def test_arun_raises_timeout_error(self) -> None:
+        shell = ThisLocalShell()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(shell.arun(["sleep", "5"], timeout=0.1))
+
+    def test_run_streaming_provides_output_lines(self) -> None:
+        shell = ThisLocalShell()
+        lines = list(shell.run_streaming("echo one; echo two"))
+        assert lines == [b"one\n", b"two\n"]
+
+    def test_run_streaming_raises_error_if_command_fails(self) -> None:
+        shell = ThisLocalShell()
+        lines = []
+        with pytest.raises(subprocess.CalledProcessError):
+            for line in shell.run_streaming("echo one; exit 2"):
+                lines.append(line)
+        assert lines == [b"one\n"]
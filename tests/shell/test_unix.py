@@ -1,9 +1,16 @@
+import os
 from typing import Optional
 
 import pytest
 
 from shellfs.core import CommandResult, PathEntry, PathType
-from shellfs.shell.unix import FSOpsCommand4Unix
+from shellfs.shell.unix import (
+    FSOpsCommand4Unix,
+    FSOpsCommand4UnixGNU,
+    FSOpsCommand4UnixStat,
+    PersistentUnixShell,
+    unquote_c_name,
+)
 # PREPARED: from shellfs.shell.unix import UnixShell
 
 
@@ -31,6 +38,74 @@ class TestUnixShell:
     pass
 
 
+class TestPersistentUnixShell:
+    @pytest.fixture
+    def shell(self):
+        this_shell = PersistentUnixShell()
+        yield this_shell
+        this_shell.close()
+
+    def test_run_many_commands_in_same_process(self, shell) -> None:
+        result1 = shell.run("echo $$")
+        result2 = shell.run("echo $$")
+        assert result1.returncode == 0
+        assert result1.stdout == result2.stdout
+
+    def test_run_captures_stdout_stderr_and_return_code(self, shell) -> None:
+        result = shell.run("echo OUTPUT; echo ERROR >&2; exit_with() { return $1; }; exit_with 3")
+        assert result.returncode == 3
+        assert result.stdout == b"OUTPUT\n"
+        assert result.stderr == b"ERROR\n"
+
+    @pytest.mark.parametrize("command", ["cd /", "set -e", "exit 3"])
+    def test_run_does_not_change_shell_for_later_commands(self, shell, tmp_path,
+                                                          monkeypatch, command) -> None:
+        (tmp_path/"some_file.txt").write_text("")
+        monkeypatch.chdir(tmp_path)
+        shell.run(command)
+        result = shell.run("false; ls some_file.txt")
+        assert result.returncode == 0
+        assert result.stdout == b"some_file.txt\n"
+
+    def test_run_with_non_utf8_filename(self, shell, tmp_path) -> None:
+        this_path = os.path.join(os.fsencode(tmp_path), b"caf\xe9.txt")
+        with open(this_path, "w"):
+            pass
+        result = shell.run(["test", "-e", os.fsdecode(this_path)])
+        assert result.returncode == 0
+
+    def test_run_with_argv_command(self, shell, tmp_path) -> None:
+        this_path = tmp_path/"some file.txt"
+        this_path.write_text("")
+        result = shell.run(["ls", "-ldAL", str(this_path)])
+        assert result.returncode == 0
+        assert result.stdout.rstrip().endswith(str(this_path).encode())
+
+    def test_run_uses_current_working_directory(self, shell, tmp_path, monkeypatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = shell.run(["pwd"])
+        assert result.stdout.decode().strip() == str(tmp_path.resolve())
+
+    def test_run_uses_new_process_if_shell_is_busy(self, shell) -> None:
+        with shell._lock:
+            # -- CASE: Lock is held by another thread (while a command runs).
+            result = shell.run(["echo", "BUSY"])
+        assert result.returncode == 0
+        assert result.stdout == b"BUSY\n"
+        assert shell._process is None
+
+    def test_process_is_started_on_first_command(self, shell) -> None:
+        assert shell._process is None
+        shell.run("true")
+        assert shell._process is not None
+
+    def test_run_restarts_shell_if_process_has_died(self, shell) -> None:
+        result1 = shell.run("exit 5")
+        result2 = shell.run("echo ALIVE")
+        assert result1.returncode == 5
+        assert result2.stdout == b"ALIVE\n"
+
+
 class TestFSOpsCommand4Unix:
     """
     EXAMPLES::
@@ -52,6 +127,11 @@ class TestFSOpsCommand4Unix:
         -rw-r--r--  1 alice  users  2879 Oct 27 11:30 this_file.txt
     """
 
+    def test_make_command4info_returns_argv(self):
+        fsops_command = FSOpsCommand4Unix()
+        command = fsops_command.make_command4info("some dir/some file.txt")
+        assert command == ["ls", "-ldAL", "some dir/some file.txt"]
+
     @pytest.mark.parametrize("text, expected", [
         ("-rw-r--r--", PathType.FILE),
         ("drwxr-xr-x", PathType.DIRECTORY),
@@ -68,6 +148,8 @@ class TestFSOpsCommand4Unix:
         ("dir1/nested_file.txt", "-rw-r--r--  1 bob  users  4002 1730054322 dir1/nested_file.txt"),
         ("iso_timestamp.txt", "-rw-r--r--  1 charly  users  4003 2024-10-27T12:19:03 iso_timestamp.txt"),
         ("many_words_timestamp.txt", "-rw-r--r--  1 doro  users  4004 Oct 27 11:30 many_words_timestamp.txt"),
+        ("name with spaces.txt", "-rw-r--r--  1 emil  users  4001 Oct 27 11:30 name with spaces.txt"),
+        ("bytes_output.txt", b"-rw-r--r--  1 fred  users  4002 1730054322 bytes_output.txt\n"),
     ])
     def test_make_result4info__with_file(self, path, output):
         command_result = make_command_result_from_output(output)
@@ -114,6 +196,37 @@ class TestFSOpsCommand4Unix:
         assert entry["type"] == PathType.NOT_FOUND
         assert this_size == 0
 
+    def test_make_command4info_and_listdir__skips_listdir_for_non_directory(self):
+        fsops_command = FSOpsCommand4Unix()
+        command = fsops_command.make_command4info_and_listdir("some file.txt")
+        sep = FSOpsCommand4Unix.BATCH_SEPARATOR
+        assert command == (
+            f"ls -ldAL 'some file.txt'; echo '{sep}'$?; "
+            f"test -d 'some file.txt' && ls -lAL 'some file.txt'; echo '{sep}'$?"
+        )
+
+    def test_make_result4info_many__maps_output_to_paths(self):
+        paths = ["some_file.txt", "MISSING_FILE.txt", "/tmp/some_directory"]
+        output = b"""\
+drwxr-xr-x 3 bob    users 4096 Oct 27 12:02 /tmp/some_directory
+-rw-r--r-- 1 charly users  123 Oct 27 12:03 some_file.txt
+"""
+        command_result = make_command_result_from_output(output, return_code=2)
+        path_entries = FSOpsCommand4Unix.make_result4info_many(command_result, paths)
+        expected = [
+            PathEntry(name="some_file.txt", type=PathType.FILE, size=123),
+            PathEntry(name="MISSING_FILE.txt", type=PathType.NOT_FOUND, size=None),
+            PathEntry(name="/tmp/some_directory", type=PathType.DIRECTORY, size=4096),
+        ]
+        assert path_entries == expected
+
+    def test_make_result4info_many__with_unmapped_output(self):
+        paths = ["some_file.txt", "MISSING_FILE.txt"]
+        output = b"-rw-r--r-- 1 charly users  123 Oct 27 12:03 UNEXPECTED_NAME.txt\n"
+        command_result = make_command_result_from_output(output)
+        path_entries = FSOpsCommand4Unix.make_result4info_many(command_result, paths)
+        assert path_entries == [None, None]
+
     def test_make_result4listdir__with_existing_directory(self):
         directory = "some_directory",
         output = """\
@@ -150,3 +263,118 @@ drwxr-xr-x 3 bob    users 4096 Oct 27 12:02 some_directory
             PathEntry(name="some_file.txt", type=PathType.FILE, size=123),
         ]
         assert contained == expected
+
+    def test_make_result4listdir__with_undecodable_name(self):
+        directory = "some_directory"
+        output = b"-rw-r--r-- 1 charly users  123 Oct 27 12:03 caf\xe9.txt\n"
+        command_result = make_command_result_from_output(output)
+        contained = FSOpsCommand4Unix.make_result4listdir(command_result, directory)
+        assert contained[0]["name"] == "caf\udce9.txt"
+        assert os.fsencode(contained[0]["name"]) == b"caf\xe9.txt"
+
+    def test_parse_listdir_lines__with_existing_directory(self):
+        lines = [
+            b"total 8\n",
+            b"-rw-r--r-- 1 alice  users    0 Oct 27 12:01 EMPTY_FILE.txt\n",
+            b"drwxr-xr-x 3 bob    users 4096 Oct 27 12:02 some_directory\n",
+        ]
+        contained = list(FSOpsCommand4Unix.parse_listdir_lines(lines))
+        expected = [
+            PathEntry(name="EMPTY_FILE.txt", type=PathType.FILE, size=0),
+            PathEntry(name="some_directory", type=PathType.DIRECTORY, size=4096),
+        ]
+        assert contained == expected
+
+    def test_make_result4listdir__with_marker_in_filename(self):
+        directory = "some_directory"
+        output = b"""\
+total 4
+-rw-r--r-- 1 charly users  123 Oct 27 12:03 No such file or directory.txt
+"""
+        command_result = make_command_result_from_output(output)
+        contained = FSOpsCommand4Unix.make_result4listdir(command_result, directory)
+        expected = [
+            PathEntry(name="No such file or directory.txt", type=PathType.FILE, size=123),
+        ]
+        assert contained == expected
+
+
+class TestFSOpsCommand4UnixStat:
+    @pytest.mark.parametrize("output, expected", [
+        # -- GNU stat:
+        (b"regular file|123|1730025034|some_file.txt\n",
+         PathEntry(name="some_file.txt", type=PathType.FILE, size=123)),
+        (b"regular empty file|0|1730025034|empty_file.txt\n",
+         PathEntry(name="empty_file.txt", type=PathType.FILE, size=0)),
+        (b"directory|4096|1730027943|some_directory\n",
+         PathEntry(name="some_directory", type=PathType.DIRECTORY, size=4096)),
+        # -- BSD stat:
+        (b"Directory|320|1730027943|some_directory\n",
+         PathEntry(name="some_directory", type=PathType.DIRECTORY, size=320)),
+        (b"Regular File|123|1730025034|name|with|bars.txt\n",
+         PathEntry(name="name|with|bars.txt", type=PathType.FILE, size=123)),
+    ])
+    def test_make_result4info(self, output, expected):
+        command_result = make_command_result_from_output(output)
+        path_entry = FSOpsCommand4UnixStat.make_result4info(command_result, expected["name"])
+        assert path_entry == expected
+
+    def test_make_result4info__with_path_not_found(self):
+        output = b""
+        command_result = make_command_result_from_output(output, return_code=1)
+        path_entry = FSOpsCommand4UnixStat.make_result4info(command_result, "MISSING_FILE.txt")
+        assert path_entry["type"] is PathType.NOT_FOUND
+
+    def test_make_result4info_many__maps_output_to_paths(self):
+        paths = ["some_file.txt", "MISSING_FILE.txt", "some_directory"]
+        output = b"""\
+regular file|123|1730025034|some_file.txt
+directory|4096|1730027943|some_directory
+"""
+        command_result = make_command_result_from_output(output, return_code=1)
+        path_entries = FSOpsCommand4UnixStat.make_result4info_many(command_result, paths)
+        assert [path_entry["type"] for path_entry in path_entries] == [
+            PathType.FILE, PathType.NOT_FOUND, PathType.DIRECTORY
+        ]
+
+    def test_info_with_local_stat(self, tmp_path):
+        this_path = tmp_path/"some file.txt"
+        this_path.write_text("SOME TEXT")
+        fsops_command = FSOpsCommand4UnixStat()
+        result = PersistentUnixShell().run(fsops_command.make_command4info(str(this_path)))
+        path_entry = fsops_command.make_result4info(result, str(this_path))
+        assert path_entry == PathEntry(name=str(this_path), type=PathType.FILE, size=9)
+
+
+class TestFSOpsCommand4UnixGNU:
+    @pytest.mark.parametrize("quoted_name, expected", [
+        (b'"some_file.txt"', b"some_file.txt"),
+        (b'"some file.txt"', b"some file.txt"),
+        (b'"name\\nwith\\tescapes.txt"', b"name\nwith\tescapes.txt"),
+        (b'"say \\"hello\\".txt"', b'say "hello".txt'),
+        (b'"back\\\\slash.txt"', b"back\\slash.txt"),
+        (b'"caf\\351.txt"', b"caf\xe9.txt"),
+        (b"unquoted.txt", b"unquoted.txt"),
+    ])
+    def test_unquote_c_name(self, quoted_name, expected):
+        assert unquote_c_name(quoted_name) == expected
+
+    def test_make_command4info_many_quotes_names(self):
+        fsops_command = FSOpsCommand4UnixGNU()
+        command = fsops_command.make_command4info_many(["a.txt", "b c.txt"])
+        assert command == ["ls", "-ldAL", "-Q", "--", "a.txt", "b c.txt"]
+
+    def test_make_result4info_many__with_quoted_names(self):
+        paths = ["some file.txt", "MISSING_FILE.txt", "name\nwith newline"]
+        output = b"""\
+-rw-r--r-- 1 charly users  123 Oct 27 12:03 "name\\nwith newline"
+-rw-r--r-- 1 charly users   42 Oct 27 12:03 "some file.txt"
+"""
+        command_result = make_command_result_from_output(output, return_code=2)
+        path_entries = FSOpsCommand4UnixGNU.make_result4info_many(command_result, paths)
+        expected = [
+            PathEntry(name="some file.txt", type=PathType.FILE, size=42),
+            PathEntry(name="MISSING_FILE.txt", type=PathType.NOT_FOUND, size=None),
+            PathEntry(name="name\nwith newline", type=PathType.FILE, size=123),
+        ]
+        assert path_entries == expected
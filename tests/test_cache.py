@@ -0,0 +1,53 @@
+from shellfs.cache import TTLCache
+
+
+# -----------------------------------------------------------------------------
+# TEST SUPPORT:
+# -----------------------------------------------------------------------------
+class FakeTimer:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
+class TestTTLCache:
+    def test_get_returns_cached_value(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=1.0, timer=FakeTimer())
+        cache.put("some_path", "VALUE_1")
+        assert cache.get("some_path") == "VALUE_1"
+        assert "some_path" in cache
+
+    def test_get_returns_default_if_value_has_expired(self) -> None:
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=4, ttl=1.0, timer=timer)
+        cache.put("some_path", "VALUE_1")
+        timer.now = 1.5
+        assert cache.get("some_path") is None
+        assert len(cache) == 0
+
+    def test_put_evicts_least_recently_used_value(self) -> None:
+        cache = TTLCache(maxsize=2, ttl=1.0, timer=FakeTimer())
+        cache.put("path_1", "VALUE_1")
+        cache.put("path_2", "VALUE_2")
+        cache.get("path_1")
+        cache.put("path_3", "VALUE_3")
+        assert cache.keys() == ["path_1", "path_3"]
+
+    def test_discard_removes_value(self) -> None:
+        cache = TTLCache(maxsize=2, ttl=1.0, timer=FakeTimer())
+        cache.put("path_1", "VALUE_1")
+        cache.discard("path_1")
+        cache.discard("UNKNOWN_PATH")
+        assert cache.get("path_1") is None
+
+    def test_get_returns_cached_value_without_ttl(self) -> None:
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=4, ttl=None, timer=timer)
+        cache.put("some_path", "VALUE_1")
+        timer.now = 1.0e6
+        assert cache.get("some_path") == "VALUE_1"
@@ -1,8 +1,39 @@
+import asyncio
+import os
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from shellfs.core import PathType
+from shellfs.core import (
+    FileSystemProtocol,
+    FSOperation,
+    FSOpsCommand,
+    PathEntry,
+    PathEntryBatch,
+    PathType,
+)
+from shellfs.shell.unix import UnixShell
+
+
+# -----------------------------------------------------------------------------
+# TEST SUPPORT:
+# -----------------------------------------------------------------------------
+class CountingUnixShell(UnixShell):
+    """Records the commands that were run."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.commands = []
+
+    def run(self, command, timeout=None, **kwargs):
+        self.commands.append(command)
+        return super().run(command, timeout=timeout, **kwargs)
+
+
+# -----------------------------------------------------------------------------
+# TEST SUITE:
+# -----------------------------------------------------------------------------
 
 
 class TestPathType:
@@ -13,6 +44,7 @@ class TestPathType:
         (PathType.DIRECTORY, PathType.DIRECTORY),
         (PathType.DIRECTORY, "directory"),
         (PathType.DIRECTORY, "DIRECTORY"),
+        (PathType.DIRECTORY, 1),
     ])
     def test_equal_returns_true_for_matching_other(self, path_type: PathType, other: Any) -> None:
         assert path_type == other
@@ -24,8 +56,393 @@ class TestPathType:
         (PathType.DIRECTORY, PathType.FILE),
         (PathType.DIRECTORY, "other"),
         (PathType.DIRECTORY, "file"),
+        (PathType.DIRECTORY, 2),
     ])
     def test_equal_returns_false_for_mismatched_other(self, path_type: PathType, other: Any) -> None:
         assert (path_type == other) is False
 
+    def test_is_int_with_name_as_string(self) -> None:
+        assert int(PathType.FILE) == 2
+        assert str(PathType.FILE) == "file"
+        assert f"{PathType.DIRECTORY}" == "directory"
+        assert {PathType.FILE: "VALUE"}[2] == "VALUE"
+
+
+class TestPathEntry:
+    def test_provides_dict_like_access(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        assert path_entry["name"] == "some_file.txt"
+        assert path_entry["type"] is PathType.FILE
+        assert path_entry.get("size") == 123
+        assert path_entry.get("UNKNOWN", "DEFAULT") == "DEFAULT"
+        assert dict(path_entry) == dict(name="some_file.txt", type=PathType.FILE,
+                                        size=123, islink=False)
+
+    def test_setitem_changes_field(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        path_entry["size"] = 42
+        assert path_entry.size == 42
+
+    @pytest.mark.parametrize("other", [
+        None, 1, "some_file.txt", {"name": "some_file.txt"},
+    ])
+    def test_equal_returns_false_for_other_value(self, other: Any) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        assert (path_entry == other) is False
+        assert (path_entry != other) is True
+
+    def test_equal_with_dict_without_size(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        assert path_entry == {"name": "some_file.txt", "type": "file"}
+        assert path_entry != {"name": "other_file.txt", "type": "file"}
+
+    def test_contained_in_list_with_other_values(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        assert path_entry not in [None, 1]
+        assert path_entry in [None, dict(path_entry)]
+
+    def test_copy_returns_dict(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        this_copy = path_entry.copy()
+        this_copy["name"] = "other_file.txt"
+        assert this_copy == dict(name="other_file.txt", type=PathType.FILE,
+                                 size=123, islink=False)
+        assert path_entry.name == "some_file.txt"
+
+    def test_update_changes_fields(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE, size=123)
+        path_entry.update(size=42)
+        assert path_entry.size == 42
+
+    def test_setitem_raises_error_with_unknown_field(self) -> None:
+        path_entry = PathEntry(name="some_file.txt", type=PathType.FILE)
+        with pytest.raises(KeyError):
+            path_entry["UNKNOWN"] = 42
+
+
+class TestPathEntryBatch:
+    def test_append_stores_entry_in_parallel_lists(self) -> None:
+        batch = PathEntryBatch()
+        batch.append("some_file.txt", PathType.FILE, 123)
+        batch.append("some_directory", PathType.DIRECTORY, 4096)
+        assert len(batch) == 2
+        assert batch.names == ["some_file.txt", "some_directory"]
+        assert batch.types == [PathType.FILE, PathType.DIRECTORY]
+        assert list(batch.sizes) == [123, 4096]
+
+    def test_as_entries_returns_path_entries(self) -> None:
+        expected = [
+            PathEntry(name="some_file.txt", type=PathType.FILE, size=123),
+            PathEntry(name="some_directory", type=PathType.DIRECTORY, size=4096),
+        ]
+        batch = PathEntryBatch.from_entries(expected)
+        assert batch.as_entries() == expected
+        assert batch[1] == expected[1]
+        assert batch == expected
+
+
+class TestFSOpsCommand:
+    class ThisFSOpsCommand(FSOpsCommand):
+        COMMAND_SCHEMA4INFO = "ls -ld {path}"
+
+    def test_select_command_schema_for_known_operation(self) -> None:
+        fsops_command = self.ThisFSOpsCommand()
+        command_schema = fsops_command._select_command_schema_for(FSOperation.INFO)
+        assert command_schema == "ls -ld {path}"
+
+    def test_select_command_schema_for_unknown_operation_raises_error(self) -> None:
+        fsops_command = self.ThisFSOpsCommand()
+        with pytest.raises(LookupError):
+            fsops_command._select_command_schema_for(FSOperation.LISTDIR)
+
+    def test_make_command4info_with_one_placeholder(self) -> None:
+        fsops_command = self.ThisFSOpsCommand()
+        command = fsops_command.make_command4info("some_file.txt")
+        assert command == "ls -ld some_file.txt"
+
+    def test_make_command4copy_file_with_many_placeholders(self) -> None:
+        class ThisFSOpsCommand(FSOpsCommand):
+            USE_COMMAND_ARGV = True
+            COMMAND_SCHEMA4COPY_FILE = "cp {from_path} {to_path}"
+
+        fsops_command = ThisFSOpsCommand()
+        command = fsops_command.make_command4copy_file("file 1.txt", "file2.txt")
+        assert command == ["cp", "file 1.txt", "file2.txt"]
+
+    def test_make_batch_command_joins_commands_with_separator(self) -> None:
+        fsops_command = self.ThisFSOpsCommand()
+        command = fsops_command.make_batch_command(FSOperation.INFO,
+                                                   ["a.txt", "b c.txt"],
+                                                   sep="SEP:")
+        expected = "ls -ld a.txt; echo 'SEP:'$?; ls -ld 'b c.txt'; echo 'SEP:'$?"
+        assert command == expected
+
+    def test_split_batch_output_returns_return_code_and_output_per_command(self) -> None:
+        output = "line_1\nline_2\nSEP:0\nSEP:2\nline_3\nSEP:0\n"
+        parts = FSOpsCommand.split_batch_output(output, sep="SEP:")
+        expected = [
+            (0, "line_1\nline_2\n"),
+            (2, ""),
+            (0, "line_3\n"),
+        ]
+        assert parts == expected
+
+    def test_split_batch_output_with_bytes_output(self) -> None:
+        output = b"line_1\nSEP:0\nSEP:2\n"
+        parts = FSOpsCommand.split_batch_output(output, sep="SEP:")
+        assert parts == [(0, b"line_1\n"), (2, b"")]
+
+    def test_split_batch_output_with_empty_output(self) -> None:
+        parts = FSOpsCommand.split_batch_output("", sep="SEP:")
+        assert parts == []
+
+
+class TestFileSystemProtocol:
+    def test_info_uses_negative_lookup_cache_for_missing_path(self, tmp_path: Path) -> None:
+        this_path = tmp_path/"MISSING_FILE.txt"
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        assert fs_protocol.info(this_path)["type"] is PathType.NOT_FOUND
+        assert fs_protocol.exists(this_path) is False
+        assert len(shell.commands) == 1
+
+    def test_listdir_uses_cached_listing_of_unchanged_directory(self, tmp_path: Path) -> None:
+        (tmp_path/"some_file.txt").write_text("")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        assert fs_protocol.listdir(tmp_path).names == ["some_file.txt"]
+        assert fs_protocol.listdir(tmp_path).names == ["some_file.txt"]
+        assert len(shell.commands) == 1
+
+    def test_listdir_discards_cached_listing_if_directory_was_modified(self, tmp_path: Path) -> None:
+        (tmp_path/"some_file.txt").write_text("")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+        fs_protocol.listdir(tmp_path)
+
+        # -- CASE: Modified by others (bypassing this fs_protocol).
+        (tmp_path/"other_file.txt").write_text("")
+        stat_result = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1000))
+        assert sorted(fs_protocol.listdir(tmp_path).names) == ["other_file.txt", "some_file.txt"]
+        assert len(shell.commands) == 2
+
+    def test_info_and_listdir_with_empty_path_does_not_cache_current_directory(self) -> None:
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+        fs_protocol.info_and_listdir("")
+
+        assert fs_protocol.info(os.getcwd())["type"] is PathType.DIRECTORY
+        assert fs_protocol._make_cache_key("") is None
+
+    def test_listings_expiry_time_has_same_meaning_as_for_fsspec(self) -> None:
+        fs_protocol1 = FileSystemProtocol(CountingUnixShell())
+        fs_protocol2 = FileSystemProtocol(CountingUnixShell(), listings_expiry_time=None)
+        assert fs_protocol1._listdir_cache.ttl == FileSystemProtocol.DEFAULT_LISTINGS_EXPIRY_TIME
+        assert fs_protocol2._listdir_cache.ttl is None   # -- NEVER EXPIRES.
+
+    def test_info_uses_cached_info_with_name_of_requested_path(self, tmp_path: Path,
+                                                               monkeypatch) -> None:
+        (tmp_path/"some_file.txt").write_text("")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+        monkeypatch.chdir(tmp_path)
+
+        assert fs_protocol.info("some_file.txt")["name"] == "some_file.txt"
+        this_path = str(tmp_path/"some_file.txt")
+        assert fs_protocol.info(this_path)["name"] == this_path
+        assert len(shell.commands) == 1
+
+    def test_info_provides_copy_of_cached_info(self, tmp_path: Path) -> None:
+        this_path = tmp_path/"some_file.txt"
+        this_path.write_text("SOME TEXT")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        fs_protocol.info(this_path)["size"] = 999
+        fs_protocol.info(this_path)["size"] = 999
+        assert fs_protocol.info(this_path)["size"] == 9
+        assert len(shell.commands) == 1
+
+    def test_info_is_invalidated_by_touch(self, tmp_path: Path) -> None:
+        this_path = tmp_path/"some_file.txt"
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        assert fs_protocol.exists(this_path) is False
+        fs_protocol.touch(this_path)
+        assert fs_protocol.isfile(this_path) is True
+        assert fs_protocol.isfile(this_path) is True
+        assert len(shell.commands) == 3
+
+    def test_info_without_listings_cache_runs_command_each_time(self, tmp_path: Path) -> None:
+        this_path = tmp_path/"MISSING_FILE.txt"
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell, use_listings_cache=False)
+
+        assert fs_protocol.exists(this_path) is False
+        assert fs_protocol.exists(this_path) is False
+        assert len(shell.commands) == 2
+
+    def test_exists_fast_uses_return_code_of_exists_command(self, tmp_path: Path) -> None:
+        this_path = tmp_path/"some_file.txt"
+        this_path.write_text("")
+        this_missing_path = tmp_path/"MISSING_FILE.txt"
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        assert fs_protocol.exists_fast(this_path) is True
+        assert fs_protocol.exists_fast(this_missing_path) is False
+        assert fs_protocol.exists_fast(this_missing_path) is False
+        assert shell.commands == [
+            ["test", "-e", str(this_path)],
+            ["test", "-e", str(this_missing_path)],
+        ]
+
+    @pytest.mark.parametrize("path", ["", ".", "/"])
+    def test_info_and_exists_with_well_known_directory_run_no_command(self, path: str) -> None:
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell, use_listings_cache=False)
+
+        assert fs_protocol.info(path)["type"] is PathType.DIRECTORY
+        assert fs_protocol.exists_fast(path) is True
+        assert shell.commands == []
+
+    def test_exists_fast_without_exists_command_uses_info(self, tmp_path: Path) -> None:
+        shell = CountingUnixShell()
+        class ThisFSOpsCommand(type(shell.fsops_command)):
+            COMMAND_SCHEMA4EXISTS = None
+        shell.fsops_command = ThisFSOpsCommand()
+        fs_protocol = FileSystemProtocol(shell)
+
+        assert fs_protocol.exists_fast(tmp_path) is True
+        assert fs_protocol.exists_fast(tmp_path/"MISSING_FILE.txt") is False
+        assert len(shell.commands) == 2
+
+    def test_exists_fast_propagates_error_of_exists_command(self, tmp_path: Path) -> None:
+        shell = CountingUnixShell()
+        class ThisFSOpsCommand(type(shell.fsops_command)):
+            @classmethod
+            def make_result4exists(cls, result, path):
+                raise KeyError("OOPS")
+        shell.fsops_command = ThisFSOpsCommand()
+        fs_protocol = FileSystemProtocol(shell)
+
+        with pytest.raises(KeyError):
+            fs_protocol.exists_fast(tmp_path)
+        assert len(shell.commands) == 1
+
+    def test_infos_runs_one_command_for_many_paths(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file.txt"
+        this_file_path.write_text("SOME TEXT")
+        this_missing_path = tmp_path/"MISSING_FILE.txt"
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        this_paths = [str(this_missing_path), str(tmp_path), str(this_file_path)]
+        path_entries = fs_protocol.infos(this_paths)
+        assert [path_entry["type"] for path_entry in path_entries] == [
+            PathType.NOT_FOUND, PathType.DIRECTORY, PathType.FILE
+        ]
+        assert path_entries[2]["size"] == 9
+        assert len(shell.commands) == 1
+        assert shell.commands[0][-3:] == this_paths
+
+    def test_info_many_parallel_runs_one_command_per_path(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file.txt"
+        this_file_path.write_text("SOME TEXT")
+        this_missing_path = tmp_path/"MISSING_FILE.txt"
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        this_paths = [str(this_missing_path), str(tmp_path), str(this_file_path)]
+        path_entries = fs_protocol.info_many_parallel(this_paths)
+        assert [path_entry["type"] for path_entry in path_entries] == [
+            PathType.NOT_FOUND, PathType.DIRECTORY, PathType.FILE
+        ]
+        assert len(shell.commands) == 3
+
+    def test_info_many_without_multi_path_command_runs_commands_in_parallel(
+            self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file.txt"
+        this_file_path.write_text("SOME TEXT")
+        shell = CountingUnixShell()
+        fsops_command_class = type(shell.fsops_command)
+        class ThisFSOpsCommand(fsops_command_class):
+            COMMAND_SCHEMA4INFO_MANY = None
+        shell.fsops_command = ThisFSOpsCommand()
+        fs_protocol = FileSystemProtocol(shell)
+
+        this_paths = [str(tmp_path/"MISSING_FILE.txt"), str(this_file_path)]
+        path_entries = fs_protocol.infos(this_paths)
+        assert [path_entry["type"] for path_entry in path_entries] == [
+            PathType.NOT_FOUND, PathType.FILE
+        ]
+        assert len(shell.commands) == 2
+
+    def test_ainfos_limits_concurrent_commands_for_many_paths(self, tmp_path: Path) -> None:
+        class ThisShell(CountingUnixShell):
+            active = 0
+            max_active = 0
+
+            async def arun(self, command, timeout=None):
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    return await super().arun(command, timeout=timeout)
+                finally:
+                    self.active -= 1
+
+        shell = ThisShell()
+        fs_protocol = FileSystemProtocol(shell, use_listings_cache=False)
+        this_paths = [str(tmp_path/f"MISSING_FILE_{index}.txt") for index in range(50)]
+        path_entries = asyncio.run(fs_protocol.ainfos(this_paths))
+        assert len(path_entries) == 50
+        assert all(path_entry["type"] is PathType.NOT_FOUND for path_entry in path_entries)
+        assert 1 < shell.max_active <= FileSystemProtocol.INFO_MAX_WORKERS
+
+    def test_info_and_listdir_runs_one_command(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"some_directory"
+        (this_directory/"sub_directory").mkdir(parents=True)
+        (this_directory/"some_file.txt").write_text("")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+
+        path_entry, path_entries = fs_protocol.info_and_listdir(this_directory)
+        assert path_entry["type"] is PathType.DIRECTORY
+        assert sorted(path_entries.names) == ["some_file.txt", "sub_directory"]
+        assert len(shell.commands) == 1
+
+    def test_info_uses_cached_listing_of_its_directory(self, tmp_path: Path) -> None:
+        (tmp_path/"some_file.txt").write_text("SOME TEXT")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+        fs_protocol.info_and_listdir(tmp_path)
+
+        path_entry = fs_protocol.info(tmp_path/"some_file.txt")
+        assert path_entry == PathEntry(name=str(tmp_path/"some_file.txt"),
+                                       type=PathType.FILE, size=9)
+        assert len(shell.commands) == 1
+
+    def test_info_runs_command_if_name_is_missing_in_cached_listing(self, tmp_path: Path) -> None:
+        # -- HINT: Trailing whitespace of a name is lost in the ls listing.
+        this_path = tmp_path/"trailing_space.txt "
+        this_path.write_text("")
+        shell = CountingUnixShell()
+        fs_protocol = FileSystemProtocol(shell)
+        fs_protocol.info_and_listdir(tmp_path)
+
+        assert fs_protocol.exists(this_path) is True
+        assert fs_protocol.exists(tmp_path/"MISSING_FILE.txt") is False
+        assert len(shell.commands) == 3
+
+    def test_info_and_listdir_with_file(self, tmp_path: Path) -> None:
+        this_path = tmp_path/"some_file.txt"
+        this_path.write_text("")
+        fs_protocol = FileSystemProtocol(CountingUnixShell())
 
+        path_entry, path_entries = fs_protocol.info_and_listdir(this_path)
+        assert path_entry["type"] is PathType.FILE
+        assert path_entries is None
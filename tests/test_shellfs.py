@@ -1,3 +1,4 @@
+import asyncio
 import os
 from contextlib import contextmanager
 from operator import itemgetter
@@ -6,9 +7,11 @@ from shutil import rmtree
 from typing import Optional
 
 import pytest
+from fsspec.implementations.dirfs import DirFileSystem
 
 from shellfs.core import PathEntry, PathType
-from shellfs.spec import ShellFileSystem
+from shellfs.shell.direct import LocalDirectShell
+from shellfs.spec import AsyncShellFileSystem, ShellFileSystem
 
 
 # -----------------------------------------------------------------------------
@@ -134,6 +137,14 @@ class TestShellFileSystem:
         actual_outcome = shellfs.isfile(this_file_path)
         assert actual_outcome is True
 
+    def test_isfile_returns_true_with_existing_file_with_spaces(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some file with spaces.txt"
+        ensure_that_file_exists(this_file_path)
+
+        shellfs = ShellFileSystem()
+        actual_outcome = shellfs.isfile(this_file_path)
+        assert actual_outcome is True
+
     def test_isfile_returns_false_with_nonexisting_file(self, tmp_path: Path) -> None:
         this_file_path = tmp_path/"MISSING_FILE.txt"
         ensure_that_file_does_not_exist(this_file_path)
@@ -175,6 +186,72 @@ class TestShellFileSystem:
         actual_outcome = shellfs.isdir(this_file_path)
         assert actual_outcome is False
 
+    def test_infos_returns_path_entry_for_each_path(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_141.txt"
+        this_directory_path = tmp_path/"some_directory_142"
+        this_missing_path = tmp_path/"MISSING_FILE.txt"
+        ensure_that_file_exists(this_file_path, contents=make_text(size=42))
+        ensure_that_directory_exists(this_directory_path)
+        ensure_that_file_does_not_exist(this_missing_path)
+
+        shellfs = ShellFileSystem()
+        this_paths = [str(this_file_path), str(this_missing_path), str(this_directory_path)]
+        path_entries = shellfs.fs_protocol.infos(this_paths)
+        assert len(path_entries) == 3
+        assert path_entries[0]["type"] is PathType.FILE
+        assert path_entries[0]["size"] == 42
+        assert path_entries[1]["type"] is PathType.NOT_FOUND
+        assert path_entries[1]["name"] == str(this_missing_path)
+        assert path_entries[2]["type"] is PathType.DIRECTORY
+
+    def test_invalidate_cache_discards_cached_info(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_144.txt"
+        ensure_that_file_does_not_exist(this_file_path)
+
+        shellfs = ShellFileSystem()
+        assert shellfs.exists(this_file_path) is False
+        this_file_path.touch()   # -- CHANGED BY OTHERS: Not seen by cache.
+        shellfs.invalidate_cache(this_file_path)
+        assert shellfs.exists(this_file_path) is True
+
+    def test_ls_with_refresh_discards_cached_listing(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"some_directory_145"
+        ensure_that_directory_exists(this_directory)
+
+        shellfs = ShellFileSystem()
+        assert shellfs.ls(this_directory, detail=False) == []
+        (this_directory/"some_file.txt").touch()   # -- CHANGED BY OTHERS.
+        assert shellfs.ls(this_directory, detail=False, refresh=True) == ["some_file.txt"]
+
+    def test_exists_many_returns_bool_for_each_path(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_143.txt"
+        this_missing_path = tmp_path/"MISSING_FILE.txt"
+        ensure_that_file_exists(this_file_path)
+        ensure_that_file_does_not_exist(this_missing_path)
+
+        shellfs = ShellFileSystem()
+        this_paths = [str(this_file_path), str(this_missing_path), str(tmp_path)]
+        assert shellfs.exists_many(this_paths) == [True, False, True]
+
+    @pytest.mark.parametrize("path", ["/", ""])
+    def test_root_directory_is_listed_and_exists(self, path: str) -> None:
+        shellfs = ShellFileSystem(skip_instance_cache=True)
+        assert shellfs.isdir(path)
+        assert shellfs.exists_many([path]) == [True]
+        assert "tmp" in shellfs.ls(path, detail=False)
+        assert shellfs.isdir(os.getcwd())
+
+    def test_info_is_invalidated_by_mutating_operation(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_151.txt"
+        ensure_that_file_does_not_exist(this_file_path)
+
+        shellfs = ShellFileSystem()
+        assert shellfs.exists(this_file_path) is False
+        shellfs.touch(this_file_path)
+        assert shellfs.isfile(this_file_path) is True
+        shellfs.rm(this_file_path)
+        assert shellfs.exists(this_file_path) is False
+
     # -- OPERATION: listdir (aka: "ls")
     def test_ls_returns_directory_entries(self, tmp_path: Path) -> None:
         this_directory = tmp_path/"some_directory_401"
@@ -223,6 +300,91 @@ class TestShellFileSystem:
             entry_names.sort()  # -- NORMALIZE ORDERING.
             assert entry_names == expected
 
+    def test_ls_without_detail_and_listings_cache_streams_entry_names(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"some_directory_402"
+        files = [
+            (this_directory/"EMPTY_FILE.txt", ""),
+            (this_directory/"some_file.txt", make_text(size=123)),
+        ]
+        ensure_that_many_files_exist_with_contents(files)
+
+        shellfs = ShellFileSystem(use_listings_cache=False, skip_instance_cache=True)
+        assert shellfs.fs_protocol.can_stream_listdir
+        entry_names = shellfs.ls(this_directory, detail=False)
+        entry_names.sort()  # -- NORMALIZE ORDERING.
+        assert entry_names == ["EMPTY_FILE.txt", "some_file.txt"]
+
+    def test_ls_without_detail_and_listings_cache_raises_error_if_path_does_not_exist(
+            self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"MISSING_DIRECTORY"
+        ensure_that_directory_does_not_exist(this_directory)
+
+        shellfs = ShellFileSystem(use_listings_cache=False, skip_instance_cache=True)
+        with pytest.raises(FileNotFoundError):
+            shellfs.ls(this_directory, detail=False)
+
+    def test_ls_with_file_returns_file_entry(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_411.txt"
+        ensure_that_file_exists(this_file_path, contents=make_text(size=42))
+
+        shellfs = ShellFileSystem()
+        path_entries = shellfs.ls(this_file_path)
+        expected = [
+            PathEntry(name=str(this_file_path), type=PathType.FILE, size=42),
+        ]
+        assert path_entries == expected
+
+    def test_ls_raises_error_if_path_does_not_exist(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"MISSING_DIRECTORY"
+        ensure_that_directory_does_not_exist(this_directory)
+
+        shellfs = ShellFileSystem()
+        with pytest.raises(FileNotFoundError):
+            shellfs.ls(this_directory)
+
+    def test_ls_with_directory_hint_lists_directory_without_info(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"some_directory_403"
+        ensure_that_file_exists(this_directory/"some_file.txt", contents="")
+
+        shellfs = ShellFileSystem(skip_instance_cache=True)
+        shellfs.fs_protocol.info_and_listdir = None  # -- SHOULD NOT BE USED.
+        entry_names = shellfs.ls(str(this_directory), detail=False,
+                                 _hint_type=PathType.DIRECTORY)
+        assert entry_names == ["some_file.txt"]
+
+    # -- OPERATION: walk
+    def test_walk_recurses_into_sub_directories(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"some_directory_501"
+        files = [
+            (this_directory/"some_file.txt", ""),
+            (this_directory/"sub_directory/other_file.txt", ""),
+        ]
+        ensure_that_many_files_exist_with_contents(files)
+
+        shellfs = ShellFileSystem(skip_instance_cache=True)
+        walked = list(shellfs.walk(str(this_directory)))
+        expected = [
+            (str(this_directory), ["sub_directory"], ["some_file.txt"]),
+            (str(this_directory/"sub_directory"), [], ["other_file.txt"]),
+        ]
+        assert walked == expected
+
+    def test_walk_runs_info_only_on_top_directory(self, tmp_path: Path) -> None:
+        this_directory = tmp_path/"some_directory_502"
+        ensure_that_file_exists(this_directory/"sub_directory/other_file.txt", contents="")
+
+        shellfs = ShellFileSystem(skip_instance_cache=True)
+        info_and_listdir_paths = []
+        info_and_listdir = shellfs.fs_protocol.info_and_listdir
+        def info_and_listdir_spy(path):
+            info_and_listdir_paths.append(path)
+            return info_and_listdir(path)
+        shellfs.fs_protocol.info_and_listdir = info_and_listdir_spy
+
+        walked = list(shellfs.walk(str(this_directory)))
+        assert len(walked) == 2
+        assert info_and_listdir_paths == [str(this_directory)]
+
     # -- OPERATION: makedirs
     def test_makedirs_if_directory_does_not_exist_with_one_level(self, tmp_path: Path) -> None:
         this_directory = tmp_path/"some_directory_401"
@@ -458,3 +620,59 @@ class TestShellFileSystem:
         assert shellfs.exists(this_directory) is False
         assert this_file.exists() is False
         assert shellfs.exists(this_file) is False
+
+
+class TestAsyncShellFileSystem:
+    def test_info_many_returns_path_entry_for_each_path(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_901.txt"
+        this_missing_path = tmp_path/"MISSING_FILE.txt"
+        ensure_that_file_exists(this_file_path, contents=make_text(size=42))
+        ensure_that_file_does_not_exist(this_missing_path)
+
+        async def run_info_many(paths):
+            shellfs = AsyncShellFileSystem(asynchronous=True, skip_instance_cache=True)
+            return await shellfs._info_many(paths)
+
+        this_paths = [str(this_file_path), str(this_missing_path), str(tmp_path)]
+        path_entries = asyncio.run(run_info_many(this_paths))
+        assert len(path_entries) == 3
+        assert path_entries[0]["type"] is PathType.FILE
+        assert path_entries[0]["size"] == 42
+        assert path_entries[1]["type"] is PathType.NOT_FOUND
+        assert path_entries[2]["type"] is PathType.DIRECTORY
+
+    def test_sync_methods_are_provided(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_902.txt"
+        ensure_that_file_exists(this_file_path)
+
+        shellfs = AsyncShellFileSystem()
+        assert shellfs.exists(str(this_file_path)) is True
+        assert shellfs.isfile(str(this_file_path)) is True
+        assert shellfs.ls(str(tmp_path), detail=False) == ["some_file_902.txt"]
+        with pytest.raises(FileNotFoundError):
+            shellfs.info(str(tmp_path/"MISSING_FILE.txt"))
+
+
+class TestShellFileSystemInDirFileSystem:
+    def test_info_provides_relative_name(self, tmp_path: Path) -> None:
+        ensure_that_file_exists(tmp_path/"some_file.txt", contents=make_text(size=42))
+
+        dirfs = DirFileSystem(path=str(tmp_path),
+                              fs=ShellFileSystem(skip_instance_cache=True))
+        path_entry = dirfs.info("some_file.txt")
+        assert path_entry["name"] == "some_file.txt"
+        assert path_entry["type"] == "file"
+        assert path_entry["size"] == 42
+
+
+class TestShellFileSystemWithLocalDirectShell:
+    def test_ls_and_exists_see_changes_without_cache(self, tmp_path: Path) -> None:
+        this_file_path = tmp_path/"some_file_951.txt"
+        shellfs = ShellFileSystem(shell=LocalDirectShell())
+        assert shellfs.ls(tmp_path, detail=False) == []
+        assert shellfs.exists(this_file_path) is False
+
+        this_file_path.write_text("SOME TEXT")   # -- CHANGED BY OTHERS.
+        assert shellfs.ls(tmp_path, detail=False) == ["some_file_951.txt"]
+        assert shellfs.exists(this_file_path) is True
+        assert shellfs.info(this_file_path)["size"] == 9